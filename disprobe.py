@@ -1,13 +1,36 @@
+import argparse
+import atexit
 import os
 import sys
+import time
 from pathlib import Path
+from types import SimpleNamespace
 import re
 import csv
+import functools
+import hashlib
+import io
 import json
+import xml.etree.ElementTree as ET
+import xml.parsers.expat
 from urllib.parse import urlparse
 import asyncio
+import contextlib
 from colorama import init, Fore
-from playwright.async_api import async_playwright
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# httpx only decodes "br" when one of these is importable
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
 
 init(autoreset=True)
  
@@ -71,6 +94,9 @@ EXIT_PARTIAL_NETWORK = 30
 # Partial multiple: multiple different error types occurred but some items succeeded
 EXIT_PARTIAL_MULTIPLE = 40
 
+# Open debug file handle, created on first use by debug_log
+_DBG_FH = None
+
 # Track if config parsing emitted non-fatal warnings that may affect results
 config_partial_issues = False
 
@@ -98,62 +124,67 @@ Options:
   -h, --help              Show this help message and exit
 """
 
-if "-h" in sys.argv or "--help" in sys.argv:
+class _ArgParser(argparse.ArgumentParser):
+    def error(self, message):
+        # argparse would exit 2, which is EXIT_FATAL here; a bad option value is a
+        # configuration problem, and exits 1 as it did before argparse
+        print(f"[ERROR] {message}", file=sys.stderr)
+        sys.exit(EXIT_CONFIG)
+
+
+_parser = _ArgParser(prog="disprobe", usage=USAGE, add_help=False, allow_abbrev=False)
+# value options take nargs="?": a trailing flag with no value keeps the default,
+# as the hand-rolled parser did, instead of being an error
+_parser.add_argument("-h", "--help", action="store_true")
+_parser.add_argument("--version", action="store_true")
+_parser.add_argument("-s", dest="sleep_time_ms", type=int, nargs="?", const=sleep_time_ms, default=sleep_time_ms)
+_parser.add_argument("-p", dest="max_parallel_tabs", type=int, nargs="?", const=max_parallel_tabs, default=max_parallel_tabs)
+_parser.add_argument("--file", dest="config_file", nargs="?")
+_parser.add_argument("--csv", dest="csv_output", nargs="?")
+_parser.add_argument("--json", dest="json_output", nargs="?")
+# CLI expects milliseconds
+_parser.add_argument("--timeout", dest="timeout_ms", type=int, nargs="?", const=timeout_ms, default=timeout_ms)
+_parser.add_argument("--retries", type=int, nargs="?", const=retries, default=retries)
+_parser.add_argument("--retry-delay", dest="retry_delay_ms", type=int, nargs="?", const=retry_delay_ms, default=retry_delay_ms)
+_parser.add_argument("--rss-concurrency", type=int, nargs="?", const=rss_concurrency, default=rss_concurrency)
+_parser.add_argument("--no-browser", action="store_true")
+_parser.add_argument("--only-updates", dest="filter_updates", action="store_true")
+_parser.add_argument("--only-ahead", dest="filter_ahead", action="store_true")
+_parser.add_argument("--only-unknown", dest="filter_unknown", action="store_true")
+_parser.add_argument("--no-pause", action="store_true")
+_parser.add_argument("--debug", action="store_true")
+_parser.add_argument("--debug-file", nargs="?")
+_parser.add_argument("--urls", dest="urls_only", action="store_true")
+
+# unknown arguments are ignored, as they always have been
+_ns, _ = _parser.parse_known_args()
+if _ns.help:
     print(USAGE)
     sys.exit(0)
+if _ns.version:
+    print(version)
+    sys.exit(0)
 
-args = sys.argv[1:]
-i = 0
-while i < len(args):
-    arg = args[i]
-    if arg.startswith("-s") and len(arg) > 2:
-        sleep_time_ms = int(arg[2:])
-    elif arg.startswith("-p") and len(arg) > 2:
-        max_parallel_tabs = int(arg[2:])
-    elif arg == "--file" and i + 1 < len(args):
-        config_file = Path(args[i + 1]).expanduser().resolve()
-        i += 1
-    elif arg == "--csv" and i + 1 < len(args):
-        csv_output = Path(args[i + 1]).expanduser().resolve()
-        i += 1
-    elif arg == "--json" and i + 1 < len(args):
-        json_output = Path(args[i + 1]).expanduser().resolve()
-        i += 1
-    elif arg == "--timeout" and i + 1 < len(args):
-        # CLI expects milliseconds
-        timeout_ms = int(args[i + 1])
-        i += 1
-    elif arg == "--retries" and i + 1 < len(args):
-        retries = int(args[i + 1])
-        i += 1
-    elif arg == "--retry-delay" and i + 1 < len(args):
-        # CLI expects milliseconds
-        retry_delay_ms = int(args[i + 1])
-        i += 1
-    elif arg == "--rss-concurrency" and i + 1 < len(args):
-        rss_concurrency = int(args[i + 1])
-        i += 1
-    elif arg == "--no-browser":
-        no_browser = True
-    elif arg == "--only-updates":
-        filter_updates = True
-    elif arg == "--only-ahead":
-        filter_ahead = True
-    elif arg == "--only-unknown":
-        filter_unknown = True
-    elif arg == "--no-pause":
-        no_pause = True
-    elif arg == "--debug":
-        debug = True
-    elif arg == "--debug-file" and i + 1 < len(args):
-        debug_file = args[i + 1]
-        i += 1
-    elif arg == "--urls":
-        urls_only = True
-    elif arg == "--version":
-        print(version)
-        sys.exit(0)
-    i += 1
+sleep_time_ms = _ns.sleep_time_ms
+max_parallel_tabs = _ns.max_parallel_tabs
+if _ns.config_file:
+    config_file = Path(_ns.config_file).expanduser().resolve()
+if _ns.csv_output:
+    csv_output = Path(_ns.csv_output).expanduser().resolve()
+if _ns.json_output:
+    json_output = Path(_ns.json_output).expanduser().resolve()
+timeout_ms = _ns.timeout_ms
+retries = _ns.retries
+retry_delay_ms = _ns.retry_delay_ms
+rss_concurrency = _ns.rss_concurrency
+no_browser = _ns.no_browser
+filter_updates = _ns.filter_updates
+filter_ahead = _ns.filter_ahead
+filter_unknown = _ns.filter_unknown
+no_pause = _ns.no_pause
+debug = _ns.debug
+debug_file = _ns.debug_file
+urls_only = _ns.urls_only
 
 # --------------------
 # Load config
@@ -164,61 +195,128 @@ if not config_file.exists():
     print(f"[ERROR] Config file not found: {config_file}")
     sys.exit(EXIT_CONFIG)
 
-with open(config_file, "r", encoding="utf-8") as f:
-    for lineno, line in enumerate(f, start=1):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            config_partial_issues = True
-            print(f"[WARN] Line {lineno} ignored, missing '=': {line}")
-            continue
-        if line.count("=") > 1:
-            config_partial_issues = True
-            print(f"[WARN] Line {lineno} has multiple '=' signs; ignoring: {line}")
-            continue
-
-        distro, version = line.split("=", 1)
-        distro = distro.strip()
-        version = version.strip()
-
-        # support per-distro overrides using semicolon-delimited metadata
-        # e.g. fedora=38;source=url;url=https://example.org/releases;regex=Release:\\s.*?(\d+)
-        if ";" in version:
-            base, meta = version.split(";", 1)
-            version = base.strip()
-            meta_map = {}
-            for part in meta.split(";"):
-                if not part:
-                    continue
-                if "=" in part:
-                    k, v = part.split("=", 1)
-                    meta_map[k.strip().lower()] = v.strip()
-            if meta_map:
-                overrides[distro] = meta_map
-
-        if not distro or not version:
-            config_partial_issues = True
-            print(f"[WARN] Line {lineno} ignored, empty distro or version: {line}")
-            continue
-        if not re.search(r"\d", version):
-            config_partial_issues = True
-            print(f"[WARN] Line {lineno} ignored, version has no digits: {line}")
-            continue
-
-        local_versions[distro] = version
+config_data = config_file.read_text(encoding="utf-8")
+for lineno, line in enumerate(config_data.splitlines(), start=1):
+    line = line.strip()
+    if not line or line.startswith("#"):
+        continue
+    distro, sep, version = line.partition("=")
+    if not sep:
+        config_partial_issues = True
+        print(f"[WARN] Line {lineno} ignored, missing '=': {line}")
+        continue
+    distro = distro.strip()
+    version = version.strip()
+
+    # support per-distro overrides using semicolon-delimited metadata
+    # e.g. fedora=38;source=url;url=https://example.org/releases;regex=Release:\\s.*?(\d+)
+    version, _, meta = version.partition(";")
+    version = version.strip()
+    # '=' may only appear once before the metadata section
+    if "=" in version:
+        config_partial_issues = True
+        print(f"[WARN] Line {lineno} has multiple '=' signs; ignoring: {line}")
+        continue
+    if meta:
+        meta_map = {}
+        for part in meta.split(";"):
+            k, sep, v = part.partition("=")
+            if sep:
+                meta_map[k.strip().lower()] = v.strip()
+        if meta_map:
+            overrides[distro] = meta_map
+    if not distro or not version:
+        config_partial_issues = True
+        print(f"[WARN] Line {lineno} ignored, empty distro or version: {line}")
+        continue
+    if not any(c.isdigit() for c in version):
+        config_partial_issues = True
+        print(f"[WARN] Line {lineno} ignored, version has no digits: {line}")
+        continue
+
+    local_versions[distro] = version
 
 if not local_versions:
     print("[ERROR] No valid distros found in config file")
     sys.exit(EXIT_CONFIG)
 
 DW_URL = "https://distrowatch.com/table.php?distribution={}"
+DW_FEED_URL = "https://distrowatch.com/news/distro/{}.xml"
+
+
+def _feed_url_for(distro: str, source: str) -> str | None:
+    """Return the RSS feed URL to prefetch for `distro`, or None for page-only sources."""
+    if source == "rss":
+        override = overrides.get(distro, {})
+        return override.get("feed") or override.get("url")
+    if source == "distrowatch":
+        return DW_FEED_URL.format(distro.lower())
+    return None
+
+
+# Per-distro dispatch data resolved once, as parallel lists indexed alike
+distro_names = list(local_versions)
+distro_versions = [local_versions[d] for d in distro_names]
+distro_sources = [overrides.get(d, {}).get("source", "distrowatch").lower() for d in distro_names]
+distro_feed_urls = [_feed_url_for(d, s) for d, s in zip(distro_names, distro_sources)]
+
+# --------------------
+# Precompiled patterns
+# --------------------
+_RX_DIGITS = re.compile(r"\d+")
+_RX_VER = re.compile(r"\d+(?:\.\d+)*")
+_RX_VER_DOT = re.compile(r"\d+(?:\.\d+)+")
+_RX_VER_WORD = re.compile(r"\b\d+(?:\.\d+)*\b")
+_RX_VER_LOOSE = re.compile(r"([0-9]+(?:\.[0-9]+)+(?:[-.][A-Za-z0-9]+)?)")
+_RX_VER_TOKEN = re.compile(r"version[:\s]*([^\s<]+)", re.I)
+_RX_ITEM = re.compile(r"<item[\s\S]*?</item>", re.I)
+_RX_ENTRY = re.compile(r"<entry[\s\S]*?</entry>", re.I)
+# cheap gate before the item/entry parse; case-insensitive like the two above
+_RX_ITEM_OPEN = re.compile(r"<(?:item|entry)", re.I)
+_RX_TITLE = re.compile(r"<title[^>]*>([^<]+)</title>", re.I)
+_RX_TITLE_ANY = re.compile(r"<title[^>]*>(.*?)</title>", re.I)
+_RX_LINK = re.compile(r"<link[^>]*>(.*?)</link>", re.I)
+_RX_TAG = re.compile(r"<[^>]+>")
+_RX_HTML_BODY = re.compile(r"<(/?)(html|body)[^>]*>", re.I)
+_RX_XML_CT = re.compile(r"(xml|rss)", re.I)
+_RX_XML_ROOT = re.compile(r"<(?:rss|feed|entry|item)[\s>]", re.I)
+_RX_FEED_ROOT = re.compile(r"<(?:rss|feed)[\s>].*", re.S | re.I)
+_RX_WEBKIT = re.compile(r"<div[^>]+id=[\"']webkit-xml-viewer-source-xml[\"'][^>]*>(.*?)</div>", re.S | re.I)
+_RX_DIST_REL = re.compile(r"Distribution Release:\s*[^\d\n]*?(\d+(?:\.\d+)*)")
+_RX_DIST_REL_FEED = re.compile(r"Distribution Release:\s*[^\n<]*?(\d+(?:\.\d+)*)", re.I)
+_RX_SECTION = re.compile(r"Releases announcements.*?</b>(.*?)</td>", re.DOTALL)
+_RX_RELEASE_LINE = re.compile(r"^.*Distribution Release:.*$", re.M)
+# one comma-separated selection entry: "3" or "2-5"
+_RX_SEL = re.compile(r"\s*(\d+)(?:\s*-\s*(\d+))?\s*")
+
+
+class _KeepVersionChars(dict):
+    """str.translate table that keeps ASCII digits and '.' and drops everything else."""
+
+    def __missing__(self, key):
+        return None
+
+
+_VER_CHARS = _KeepVersionChars({ord(c): ord(c) for c in "0123456789."})
+
+# On-disk cache of RSS feed bodies, revalidated with ETag/Last-Modified
+_CACHE_DIR = base_dir / ".disprobe-cache"
+# Stop reading a feed body that has not matched after this many bytes
+_RSS_MAX_BODY = 1 << 20
+# Parsed (latest, link) per feed URL for the current run
+_FEED_RESULTS = {}
+# Feed URL -> future resolved by the task currently fetching it
+_INFLIGHT = {}
 
 # --------------------
 # Helpers
 # --------------------
+@functools.lru_cache(maxsize=4096)
 def version_tuple(v):
-    return tuple(int(x) for x in re.findall(r"\d+", v))
+    # well-formed dotted versions skip the findall scan
+    if _RX_VER.fullmatch(v):
+        return tuple(map(int, v.split(".")))
+    return tuple(map(int, _RX_DIGITS.findall(v)))
  
 def color(status):
     return {
@@ -238,39 +336,150 @@ def passes_filter(status):
     return True
 
 
+def _local_tag(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _parse_rss_items(text: str) -> tuple[str, str] | None:
+    """Stream <item>/<entry> elements with expat and return the first versioned title.
+
+    Raises ET.ParseError when `text` is not well-formed XML and nothing matched
+    before the error (e.g. HTML pages or a truncated buffer).
+    """
+    for _ev, el in ET.iterparse(io.StringIO(text), events=("end",)):
+        if _local_tag(el.tag) not in ("item", "entry"):
+            continue
+        t = el.findtext("{*}title") or ""
+        mver = _RX_VER.search(t)
+        if mver:
+            lnk = el.find("{*}link")
+            link_from_feed = ""
+            if lnk is not None:
+                link_from_feed = (lnk.text or lnk.get("href") or "").strip()
+            return mver.group(0), link_from_feed
+        el.clear()
+    return None
+
+
+def _parse_rss_items_loose(text: str) -> tuple[str, str] | None:
+    """Regex item scan used when the body is not well-formed XML."""
+    items = _RX_ITEM.findall(text)
+    if not items:
+        items = _RX_ENTRY.findall(text)
+    for item in items:
+        # title-based detection
+        mtitle = _RX_TITLE.search(item)
+        if mtitle:
+            mver = _RX_VER.search(mtitle.group(1))
+            if mver:
+                lnk = _RX_LINK.search(item)
+                link_from_feed = lnk.group(1).strip() if lnk else ""
+                return mver.group(0), link_from_feed
+    return None
+
+
+class _FeedMatch(Exception):
+    """Raised from expat handlers to stop parsing at the first versioned item."""
+
+    def __init__(self, latest: str, link: str):
+        super().__init__(latest, link)
+        self.latest = latest
+        self.link = link
+
+
+def _make_feed_parser():
+    """Return an expat parser that raises _FeedMatch on the first versioned item/entry.
+
+    Mirrors `_parse_rss_items` but can be fed a response body chunk by chunk.
+    """
+    parser = xml.parsers.expat.ParserCreate()
+    state = {"depth": 0, "field": None, "title": None, "link": None}
+
+    def start(name, attrs):
+        tag = name.rsplit(":", 1)[-1]
+        if tag in ("item", "entry") and not state["depth"]:
+            state.update(depth=1, field=None, title=None, link=None)
+            return
+        if not state["depth"]:
+            return
+        state["depth"] += 1
+        # only direct children of the item, first occurrence of each
+        if state["depth"] == 2 and tag in ("title", "link") and state[tag] is None:
+            state[tag] = []
+            state["field"] = tag
+            if tag == "link" and attrs.get("href"):
+                state["link"].append(attrs["href"])
+
+    def chars(data):
+        if state["field"]:
+            state[state["field"]].append(data)
+
+    def end(name):
+        if not state["depth"]:
+            return
+        state["depth"] -= 1
+        state["field"] = None
+        if state["depth"]:
+            return
+        mver = _RX_VER.search("".join(state["title"] or ()))
+        if mver:
+            raise _FeedMatch(mver.group(0), "".join(state["link"] or ()).strip())
+
+    parser.StartElementHandler = start
+    parser.CharacterDataHandler = chars
+    parser.EndElementHandler = end
+    return parser
+
+
 def parse_rss_text(text: str) -> tuple[str, str] | None:
     if not text:
         return None
-    # Look for item/entry blocks first
-    items = re.findall(r"<item[\s\S]*?</item>", text, re.I)
-    if not items:
-        items = re.findall(r"<entry[\s\S]*?</entry>", text, re.I)
-    if items:
-        for item in items:
-            # title-based detection
-            mtitle = re.search(r"<title[^>]*>([^<]+)</title>", item, re.I)
-            if mtitle:
-                t = mtitle.group(1)
-                mver = re.search(r"\d+(?:\.\d+)*", t)
-                if mver:
-                    latest = mver.group(0)
-                    lnk = re.search(r"<link[^>]*>(.*?)</link>", item, re.I)
-                    link_from_feed = lnk.group(1).strip() if lnk else ""
-                    return latest, link_from_feed
+    # Look for item/entry blocks first; a single tag search is far cheaper
+    # than a parse and rules out HTML error pages straight away
+    if _RX_ITEM_OPEN.search(text):
+        try:
+            found = _parse_rss_items(text)
+        except ET.ParseError:
+            found = _parse_rss_items_loose(text)
+        if found:
+            return found
     # No item matches: try loose title tags anywhere
-    titles = re.findall(r"<title[^>]*>(.*?)</title>", text, re.I)
+    titles = _RX_TITLE_ANY.findall(text)
     for tval in titles:
-        tplain = re.sub(r"<[^>]+>", "", tval).strip()
-        m = re.search(r"([0-9]+(?:\.[0-9]+)+(?:[-.][A-Za-z0-9]+)?)", tplain)
+        tplain = _RX_TAG.sub("", tval).strip()
+        m = _RX_VER_LOOSE.search(tplain)
         if m:
             return m.group(1), ""
     # Site-wide Distribution Release pattern
-    m = re.search(r"Distribution Release:\s*[^\n<]*?(\d+(?:\.\d+)*)", text, re.I)
+    m = _RX_DIST_REL_FEED.search(text)
     if m:
         return m.group(1), ""
     return None
 
 
+def _match_release_line(line: str, allow_fallback: bool = True) -> tuple[str, str] | None:
+    """Extract a version from a Distrowatch 'Distribution Release:' line.
+
+    Returns (method, version) for the first strategy that matches, or None.
+    """
+    m = _RX_DIST_REL.search(line)
+    if m:
+        return "spec", m.group(1)
+    m = _RX_VER_DOT.search(line)
+    if m:
+        return "dotted", m.group(0)
+    m = _RX_VER_TOKEN.search(line)
+    if m:
+        cand = m.group(1).translate(_VER_CHARS)
+        if cand:
+            return "version_token", cand
+    if allow_fallback:
+        m = _RX_VER_WORD.search(line)
+        if m:
+            return "fallback", m.group(0)
+    return None
+
+
 def _rss_feed_matches_distro(text: str | None, distro: str) -> bool:
     """Return True if the fetched RSS/XML/text appears to be for `distro`.
 
@@ -291,7 +500,7 @@ def _rss_feed_matches_distro(text: str | None, distro: str) -> bool:
         if f"/table.php?distribution={td}" in t:
             return True
         # channel title like "DistroWatch - Ubuntu"
-        m = re.search(r"<title[^>]*>([^<]+)</title>", text, re.I)
+        m = _RX_TITLE.search(text)
         if m:
             title = m.group(1).lower()
             # check if distro slug appears in the title or vice versa
@@ -302,44 +511,156 @@ def _rss_feed_matches_distro(text: str | None, distro: str) -> bool:
         return False
 
 
+def _feed_cache_paths(feed_url: str) -> tuple[Path, Path]:
+    key = hashlib.blake2b(feed_url.encode(), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"{key}.meta.json", _CACHE_DIR / f"{key}.body"
+
+
+def _feed_cache_load(feed_url: str) -> tuple[dict, str | None]:
+    """Return (validators, body) stored for `feed_url`, or ({}, None) when not cached."""
+    meta_path, body_path = _feed_cache_paths(feed_url)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body = body_path.read_text(encoding="utf-8")
+    except Exception:
+        return {}, None
+    return meta, body
+
+
+def _feed_cache_store(feed_url: str, resp_headers, body: str) -> None:
+    """Persist `body` with the response's ETag/Last-Modified; best-effort."""
+    etag = resp_headers.get("etag")
+    last_modified = resp_headers.get("last-modified")
+    if not etag and not last_modified:
+        return
+    meta_path, body_path = _feed_cache_paths(feed_url)
+    try:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        body_path.write_text(body, encoding="utf-8")
+        meta_path.write_text(json.dumps({"url": feed_url, "etag": etag, "last_modified": last_modified}), encoding="utf-8")
+    except Exception as e:
+        debug_log("rss_cache_store_error", feed=feed_url, error=str(e))
+
+
+def _debug_dumps(payload: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, default=str)
+        except TypeError:
+            pass
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+def _debug_file_handle():
+    """Open the debug file once and keep it open (buffered) for the rest of the run."""
+    global _DBG_FH
+    if _DBG_FH is None:
+        _DBG_FH = open(debug_file, "ab", buffering=1 << 16)
+        atexit.register(_DBG_FH.close)
+    return _DBG_FH
+
+
 def debug_log(event: str, **data) -> None:
     """Emit structured debug as JSON lines to stderr or a debug file when enabled.
 
     Fields: ts (unix time), event (string), plus provided data.
     """
-    if not globals().get("debug"):
+    if not debug:
         return
     try:
-        import time, json, sys
-
         payload = {"ts": time.time(), "event": event}
         payload.update(data)
-        line = json.dumps(payload, default=str)
-        df = globals().get("debug_file")
-        if df:
+        line = _debug_dumps(payload) + b"\n"
+        if debug_file:
             try:
-                with open(df, "a", encoding="utf-8") as f:
-                    f.write(line + "\n")
+                _debug_file_handle().write(line)
+                return
             except Exception:
-                sys.stderr.write(line + "\n")
-        else:
-            sys.stderr.write(line + "\n")
+                pass
+        sys.stderr.write(line.decode("utf-8"))
     except Exception:
         # Best-effort: avoid raising from debug logging
         try:
-            import sys
-
             sys.stderr.write(f"{{\"ts\":\"{time.time()}\",\"event\":\"{event}\"}}\n")
         except Exception:
             pass
 
+# --------------------
+# Adaptive concurrency limiter for RSS fetches
+# --------------------
+class AIMDSemaphore:
+    """Semaphore whose window shrinks when the server throttles and grows on success.
+
+    Additive-increase/multiplicative-decrease, as in TCP congestion control:
+    `release(False)` halves the window, `release(True)` widens it by one up to
+    `limit`, and `release(None)` leaves it unchanged. `backoff(seconds)` holds
+    back new acquisitions, e.g. to honour a Retry-After header.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self.current = self.limit
+        self._in_use = 0
+        self._waiters = []
+        self._not_before = 0.0
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        delay = self._not_before - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        while self._in_use >= self.current:
+            fut = loop.create_future()
+            self._waiters.append(fut)
+            try:
+                await fut
+            finally:
+                if fut in self._waiters:
+                    self._waiters.remove(fut)
+        self._in_use += 1
+
+    def release(self, ok: bool | None = None) -> None:
+        self._in_use = max(0, self._in_use - 1)
+        if ok is True:
+            self.current = min(self.limit, self.current + 1)
+        elif ok is False:
+            self.current = max(1, self.current // 2)
+        # wake every waiter; each re-checks the window before taking a slot
+        waiters, self._waiters = self._waiters, []
+        for fut in waiters:
+            if not fut.done():
+                fut.set_result(None)
+
+    def backoff(self, seconds: float) -> None:
+        until = asyncio.get_running_loop().time() + seconds
+        self._not_before = max(self._not_before, until)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+
+def _retry_after_seconds(value: str | None, cap: float = 30.0) -> float:
+    """Parse a delta-seconds Retry-After value; HTTP-date values are ignored."""
+    try:
+        return max(0.0, min(cap, float(value)))
+    except (TypeError, ValueError):
+        return 0.0
+
+
 # --------------------
 # Best-effort progress bar for long fetch operations
 async def _progress_bar(tasks: list, prefix: str = "Progress", width: int = 40, interval: float = 0.12) -> None:
     """Render a simple text progress bar for the given asyncio tasks list.
 
     The bar updates until all tasks are done. Writes to stderr so it doesn't
-    interfere with regular program output which is printed later.
+    interfere with regular program output which is printed later. Completions
+    are counted with done callbacks that also wake the renderer, so an idle
+    bar sleeps until something finishes; redraws are throttled to ``interval``.
     """
     try:
         total = len(tasks)
@@ -347,17 +668,31 @@ async def _progress_bar(tasks: list, prefix: str = "Progress", width: int = 40,
             return
         import sys as _sys, math
 
+        done = 0
+        changed = asyncio.Event()
+
+        def _inc(_t) -> None:
+            nonlocal done
+            done += 1
+            changed.set()
+
+        for t in tasks:
+            t.add_done_callback(_inc)
+
+        last = -1
         while True:
-            completed = sum(1 for t in tasks if t.done())
-            frac = completed / total if total else 1.0
-            filled = int(math.floor(frac * width))
-            bar = ("#" * filled) + ("-" * (width - filled))
-            line = f"{prefix}: [{bar}] {completed}/{total}"
-            try:
-                _sys.stderr.write("\r" + line)
-                _sys.stderr.flush()
-            except Exception:
-                pass
+            completed = done
+            if completed != last:
+                last = completed
+                frac = completed / total if total else 1.0
+                filled = int(math.floor(frac * width))
+                bar = ("#" * filled) + ("-" * (width - filled))
+                line = f"{prefix}: [{bar}] {completed}/{total}"
+                try:
+                    _sys.stderr.write("\r" + line)
+                    _sys.stderr.flush()
+                except Exception:
+                    pass
             if completed >= total:
                 try:
                     _sys.stderr.write("\n")
@@ -366,6 +701,8 @@ async def _progress_bar(tasks: list, prefix: str = "Progress", width: int = 40,
                     pass
                 break
             try:
+                await changed.wait()
+                changed.clear()
                 await asyncio.sleep(interval)
             except Exception:
                 break
@@ -373,34 +710,85 @@ async def _progress_bar(tasks: list, prefix: str = "Progress", width: int = 40,
         # progress bar is best-effort; don't raise on failure
         return
 
+
+def _start_workers(jobs: list, fn, workers: int) -> tuple[list, list]:
+    """Run ``fn(*job)`` for every job on at most ``workers`` coroutines.
+
+    Returns (futures, worker_tasks): one future per job, in job order, that
+    resolves to the call's result or exception, plus the worker tasks.
+    """
+    loop = asyncio.get_running_loop()
+    futures = [loop.create_future() for _ in jobs]
+    # a shared iterator is enough to hand out work; next() never awaits
+    pending = iter(range(len(jobs)))
+
+    async def _worker() -> None:
+        for i in pending:
+            fut = futures[i]
+            try:
+                res = await fn(*jobs[i])
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+            else:
+                if not fut.done():
+                    fut.set_result(res)
+
+    def _on_worker_done(t) -> None:
+        # a cancelled worker (even one cancelled before it first ran) must not
+        # leave callers waiting on jobs nobody will pick up
+        if t.cancelled():
+            for f in futures:
+                if not f.done():
+                    f.cancel()
+
+    tasks = [asyncio.create_task(_worker()) for _ in range(max(1, min(workers, len(jobs))))]
+    for t in tasks:
+        t.add_done_callback(_on_worker_done)
+    return futures, tasks
+
 # --------------------
 # Fetch one distro
 # --------------------
-async def fetch(browser, distro, local_version, sem):
-    async with sem:
-        import time, traceback
-        page = await browser.new_page()
-        # Block images, stylesheets, fonts and media to speed up page loads
-        try:
-            async def _route_cb(route, request):
-                rtype = request.resource_type
-                if rtype in ("image", "stylesheet", "font", "media"):
-                    try:
-                        await route.abort()
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        await route.continue_()
-                    except Exception:
-                        pass
+# Static resources blocked in fetch pages. Matching by URL glob lets Chromium
+# pass everything else through without a Python callback per request.
+_BLOCKED_RESOURCES_GLOB = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,css,woff,woff2,ttf,otf,mp4,webm}"
+
+
+async def _abort_route(route):
+    try:
+        await route.abort()
+    except Exception:
+        pass
+
+
+async def _make_context_pool(browser, size: int) -> asyncio.Queue:
+    """Create `size` browser contexts with resource blocking installed once per context.
 
-            await page.route("**/*", _route_cb)
+    Contexts are handed out through a queue, which also bounds the number of
+    pages open at the same time.
+    """
+    ctx_queue = asyncio.Queue()
+    for _ in range(max(1, size)):
+        ctx = await browser.new_context()
+        try:
+            await ctx.route(_BLOCKED_RESOURCES_GLOB, _abort_route)
         except Exception:
             # routing may not be available in some environments; continue without it
             pass
+        ctx_queue.put_nowait(ctx)
+    debug_log("context_pool_created", size=ctx_queue.qsize())
+    return ctx_queue
+
+
+async def fetch(state, ctx_queue, distro, local_version):
+    import time, traceback
+    ctx = await ctx_queue.get()
+    page = None
+    try:
+        page = await ctx.new_page()
         # Determine target URL/source for this distro (allow per-distro overrides)
-        override = overrides.get(distro, {})
+        override = state.overrides.get(distro, {})
         source = override.get("source", "distrowatch").lower()
         if source == "url":
             target_url = override.get("url") or override.get("uri")
@@ -420,14 +808,14 @@ async def fetch(browser, distro, local_version, sem):
         if source == "rss":
             feed_url = override.get("feed") or override.get("url")
         elif source == "distrowatch":
-            feed_url = f"https://distrowatch.com/news/distro/{distro.lower()}.xml"
+            feed_url = DW_FEED_URL.format(distro.lower())
 
-        session = globals().get("rss_session")
-        rss_sem = globals().get("rss_sem")
+        session = state.session
+        rss_sem = state.sem
         if feed_url and session:
             try:
                 debug_log("rss_fetch", distro=distro, feed=feed_url)
-                sem = rss_sem or asyncio.Semaphore(1)
+                sem = rss_sem or AIMDSemaphore(1)
                 async with sem:
                     # Attempt a single lightweight httpx fetch and parse
                     text = None
@@ -459,7 +847,7 @@ async def fetch(browser, distro, local_version, sem):
                     need_browser_fallback = False
                     # Header-based mismatch: if server advertises a non-RSS/XML type, treat as network/fetch failure
                     try:
-                        if content_type and not re.search(r"(xml|rss)", content_type, re.I):
+                        if content_type and not _RX_XML_CT.search(content_type):
                             final_url = final_url if 'final_url' in locals() else feed_url
                             need_browser_fallback = True
                             debug_log("rss_content_type_mismatch", distro=distro, requested=feed_url, delivered=final_url, content_type=content_type)
@@ -469,30 +857,28 @@ async def fetch(browser, distro, local_version, sem):
                     if status != 200 or not text:
                         need_browser_fallback = True
                     else:
-                        if content_type and "html" in content_type.lower() and not re.search(r"<(?:rss|feed|entry|item)[\s>]", text, re.I):
+                        if content_type and "html" in content_type.lower() and not _RX_XML_ROOT.search(text):
                             need_browser_fallback = True
 
                     if need_browser_fallback:
                         debug_log("rss_http_error", distro=distro, status=status, headers=headers)
-                        # Prefer any existing playwright_rss_browser, otherwise use the browser passed to `fetch`
-                        br = globals().get("playwright_rss_browser") or browser
-                        if not br:
-                            # No dedicated RSS browser available; skip Playwright fallback here
-                            debug_log("rss_playwright_unavailable", distro=distro)
-
+                        # Use the pooled context so the resource-blocking route applies
+                        br = ctx
                         if br:
+                            rss_page = None
                             try:
-                                page = await br.new_page()
-                                await page.goto(feed_url, timeout=timeout_ms, wait_until="domcontentloaded")
+                                rss_page = await br.new_page()
+                                await rss_page.goto(feed_url, timeout=state.timeout_ms, wait_until="domcontentloaded")
                                 await asyncio.sleep(0.12)
-                                page_text = await page.content()
-                                await page.close()
+                                page_text = await rss_page.content()
+                                await rss_page.close()
+                                rss_page = None
                                 debug_log("rss_raw_snippet", distro=distro, snippet=(page_text[:20000] if page_text else ""), content_type=content_type, content_length=len(page_text) if page_text else None)
-                                m = re.search(r"<div[^>]+id=[\"']webkit-xml-viewer-source-xml[\"'][^>]*>(.*?)</div>", page_text, re.S | re.I)
+                                m = _RX_WEBKIT.search(page_text)
                                 if m:
                                     text = m.group(1)
                                 else:
-                                    m2 = re.search(r"<(?:rss|feed)[\s>].*", page_text, re.S | re.I)
+                                    m2 = _RX_FEED_ROOT.search(page_text)
                                     if m2:
                                         text = m2.group(0)
                                     else:
@@ -507,6 +893,11 @@ async def fetch(browser, distro, local_version, sem):
                                 content_type = "application/xml"
                             except Exception as e:
                                 debug_log("playwright_rss_fetch_error", distro=distro, error=str(e), exc=traceback.format_exc())
+                                if rss_page is not None:
+                                    try:
+                                        await rss_page.close()
+                                    except Exception:
+                                        pass
                     else:
                         debug_log("rss_raw_snippet", distro=distro, snippet=(text[:20000] if text else ""), content_type=content_type, content_length=len(text) if text else None)
 
@@ -522,8 +913,7 @@ async def fetch(browser, distro, local_version, sem):
 
         # If RSS found a latest, return early without loading the page
         if latest:
-            await page.close()
-            ver_tuple = version_tuple(local_version)
+            ver_tuple = state.parsed_local[distro]
             try:
                 latest_tuple = version_tuple(latest)
             except Exception:
@@ -542,7 +932,7 @@ async def fetch(browser, distro, local_version, sem):
             start = time.monotonic()
             try:
                 # Playwright timeout is already in milliseconds
-                await page.goto(url, timeout=timeout_ms, wait_until="domcontentloaded")
+                await page.goto(url, timeout=state.timeout_ms, wait_until="domcontentloaded")
                 await page.wait_for_timeout(sleep_time_ms)
                 html = await page.content()
                 elapsed = time.monotonic() - start
@@ -553,14 +943,13 @@ async def fetch(browser, distro, local_version, sem):
                     elapsed=elapsed,
                     html_len=len(html),
                     url=url,
-                    timeout_ms=timeout_ms,
+                    timeout_ms=state.timeout_ms,
                 )
                 break
             except Exception:
                 debug_log("fetch_attempt_failed", distro=distro, attempt=attempt, url=url, exc=traceback.format_exc())
                 if attempt >= attempts:
-                    await page.close()
-                    return distro, local_version, "N/A", "UNKNOWN", ""
+                    return distro, local_version, "N/A", "UNKNOWN", "", "browser"
                 # exponential backoff in milliseconds -> convert to seconds for sleep
                 backoff_ms = retry_delay_ms * (2 ** (attempt - 1))
                 debug_log("retry_sleep", distro=distro, attempt=attempt, backoff_ms=backoff_ms)
@@ -570,8 +959,7 @@ async def fetch(browser, distro, local_version, sem):
                     pass
 
         if "Distribution Name Query" in html:
-            await page.close()
-            return distro, local_version, "N/A", "UNKNOWN", ""
+            return distro, local_version, "N/A", "UNKNOWN", "", "browser"
         latest = None
 
         # If override source is URL with regex, apply the provided regex directly
@@ -589,9 +977,9 @@ async def fetch(browser, distro, local_version, sem):
         if not latest and source == "rss":
             feed_pattern = override.get("regex")
             # find <item> or <entry> blocks
-            items = re.findall(r"<item[\s\S]*?</item>", html, re.I)
+            items = _RX_ITEM.findall(html)
             if not items:
-                items = re.findall(r"<entry[\s\S]*?</entry>", html, re.I)
+                items = _RX_ENTRY.findall(html)
             for item in items:
                 text = item
                 if feed_pattern:
@@ -604,10 +992,10 @@ async def fetch(browser, distro, local_version, sem):
                     except re.error:
                         debug_log("regex_error", distro=distro, pattern=feed_pattern)
                 # fallback: look in title tags for digit sequences
-                m2 = re.search(r"<title[^>]*>([^<]+)</title>", text, re.I)
+                m2 = _RX_TITLE.search(text)
                 if m2:
                     t = m2.group(1)
-                    mver = re.search(r"\d+(?:\.\d+)*", t)
+                    mver = _RX_VER.search(t)
                     if mver:
                         latest = mver.group(0)
                         debug_log("match", distro=distro, method="rss_title", value=latest)
@@ -615,64 +1003,28 @@ async def fetch(browser, distro, local_version, sem):
 
         # Default Distrowatch parsing if no override matched or no override provided
         if not latest:
-            section = re.findall(r"Releases announcements.*?</b>(.*?)</td>", html, re.DOTALL)
+            section = _RX_SECTION.search(html)
             if section:
-                for line in section[0].splitlines():
-                    if "Distribution Release:" in line:
-                        m_spec = re.search(r"Distribution Release:\s*[^\d\n]*?(\d+(?:\.\d+)*)", line)
-                        if m_spec:
-                            latest = m_spec.group(1)
-                            debug_log("match", distro=distro, method="spec", value=latest, line=line.strip())
-                            break
-
-                        m = re.search(r"\d+(?:\.\d+)+", line)
-                        if m:
-                            latest = m.group(0)
-                            debug_log("match", distro=distro, method="dotted", value=latest, line=line.swtrip())
-                            break
-
-                        m2 = re.search(r"version[:\s]*([^\s<]+)", line, re.I)
-                        if m2:
-                            cand = re.sub(r"[^0-9.]", "", m2.group(1))
-                            if cand:
-                                latest = cand
-                                debug_log("match", distro=distro, method="version_token", value=latest, line=line.strip())
-                                break
-
-                        m3 = re.search(r"\b\d+(?:\.\d+)*\b", line)
-                        if m3:
-                            latest = m3.group(0)
-                            debug_log("match", distro=distro, method="fallback", value=latest, line=line.strip())
-                            break
+                for lm in _RX_RELEASE_LINE.finditer(section.group(1)):
+                    hit = _match_release_line(lm.group(0))
+                    if hit:
+                        method, latest = hit
+                        debug_log("match", distro=distro, method=method, value=latest, line=lm.group(0).strip())
+                        break
         # If we didn't find a version in the expected section, try a broader search
         if not latest:
             debug_log("fallback_search", distro=distro, note="section not found or no match, searching whole HTML")
-            for line in html.splitlines():
-                if "Distribution Release:" in line:
-                    m_spec = re.search(r"Distribution Release:\s*[^\d\n]*?(\d+(?:\.\d+)*)", line)
-                    if m_spec:
-                        latest = m_spec.group(1)
-                        debug_log("match", distro=distro, method="spec_whole", value=latest, line=line.strip())
-                        break
-                    m = re.search(r"\d+(?:\.\d+)+", line)
-                    if m:
-                        latest = m.group(0)
-                        debug_log("match", distro=distro, method="dotted_whole", value=latest, line=line.strip())
-                        break
-                    m2 = re.search(r"version[:\s]*([^\s<]+)", line, re.I)
-                    if m2:
-                        cand = re.sub(r"[^0-9.]", "", m2.group(1))
-                        if cand:
-                            latest = cand
-                            debug_log("match", distro=distro, method="version_token_whole", value=latest, line=line.strip())
-                            break
-
-        await page.close()
+            for lm in _RX_RELEASE_LINE.finditer(html):
+                hit = _match_release_line(lm.group(0), allow_fallback=False)
+                if hit:
+                    method, latest = hit
+                    debug_log("match", distro=distro, method=f"{method}_whole", value=latest, line=lm.group(0).strip())
+                    break
 
         if not latest:
             return distro, local_version, "N/A", "UNKNOWN", "", "browser"
 
-        lv = version_tuple(local_version)
+        lv = state.parsed_local[distro]
         dv = version_tuple(latest)
 
         if lv == dv:
@@ -680,47 +1032,76 @@ async def fetch(browser, distro, local_version, sem):
         if lv > dv:
             return distro, local_version, latest, "LOCAL AHEAD", "", "browser"
         return distro, local_version, latest, "UPDATE AVAILABLE", url, "browser"
+    finally:
+        if page is not None:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        ctx_queue.put_nowait(ctx)
 
 # --------------------
 # Main
 # --------------------
-async def try_rss_only(p, distro, local_version):
+async def try_rss_only(state, distro, local_version, source, feed_url):
     """Top-level RSS prefetch helper used by `main` tasks.
 
-    Uses globals() to read shared `rss_session`, `rss_sem`, and other
-    configuration so it can be defined at module scope.
+    Reads the shared httpx session, limiter, browser and settings from the
+    `state` namespace built by `main`. `source` and `feed_url` come from the
+    per-distro lists resolved at config load.
     """
-    session = globals().get("rss_session")
-    rss_sem_local = globals().get("rss_sem")
-    override = globals().get("overrides", {}).get(distro, {})
-    source = override.get("source", "distrowatch").lower()
-    feed_url = None
-    if source == "rss":
-        feed_url = override.get("feed") or override.get("url")
-    elif source == "distrowatch":
-        feed_url = f"https://distrowatch.com/news/distro/{distro.lower()}.xml"
+    session = state.session
     if not feed_url or not session:
         return None
-    debug_log("rss_prefetch", distro=distro, feed=feed_url)
-    sem_local = rss_sem_local or asyncio.Semaphore(1)
-    async with sem_local:
+    debug_log("rss_prefetch", distro=distro, feed=feed_url, source=source)
+    # distros sharing a feed only parse it once per run
+    if feed_url in _FEED_RESULTS:
+        debug_log("rss_prefetch_return", distro=distro, latest=_FEED_RESULTS[feed_url][0], via="memo")
+        return _FEED_RESULTS[feed_url]
+    # concurrent distros resolving to the same feed share one request
+    pending = _INFLIGHT.get(feed_url)
+    if pending is not None:
+        debug_log("rss_prefetch_coalesced", distro=distro, feed=feed_url)
+        return await asyncio.shield(pending)
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[feed_url] = fut
+    result = None
+    try:
+        result = await _fetch_feed(state, distro, feed_url)
+        return result
+    finally:
+        del _INFLIGHT[feed_url]
+        if not fut.done():
+            fut.set_result(result)
+
+
+async def _fetch_feed(state, distro, feed_url):
+    """Fetch and parse one feed for `try_rss_only`; returns (latest, link) or None."""
+    session = state.session
+    sem_local = state.sem or AIMDSemaphore(1)
+    await sem_local.acquire()
+    # outcome reported to the adaptive limiter: False = throttled, True = parsed
+    rss_ok = None
+    try:
         try:
             import random
 
-            await asyncio.sleep(random.uniform(globals().get("rss_jitter_min", 0.05), globals().get("rss_jitter_max", 0.25)))
+            await asyncio.sleep(random.uniform(*state.jitter))
         except Exception:
             pass
-        try:
-            hdrs = dict(globals().get('headers')) if 'headers' in globals() else None
-            if hdrs:
-                ua_choices = [hdrs.get('User-Agent', ''), 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0']
-                import random
+        hdrs = None
 
-                hdrs['User-Agent'] = random.choice(ua_choices)
-        except Exception:
-            hdrs = None
+        # conditional request against the on-disk cache
+        cache_meta, cached_body = _feed_cache_load(feed_url)
+        if cached_body is not None:
+            hdrs = dict(hdrs or {})
+            if cache_meta.get("etag"):
+                hdrs["If-None-Match"] = cache_meta["etag"]
+            if cache_meta.get("last_modified"):
+                hdrs["If-Modified-Since"] = cache_meta["last_modified"]
 
         text = None
+        stream_match = None
         used_playwright = False
         try:
             req_args = {'headers': hdrs} if hdrs else {}
@@ -731,62 +1112,99 @@ async def try_rss_only(p, distro, local_version):
                     info_headers = {}
                 status = resp.status_code
                 final_url = str(getattr(resp, "url", feed_url))
-                debug_log("rss_http_status", distro=distro, status=status, requested=feed_url, delivered=final_url, headers=info_headers)
+                debug_log("rss_http_status", distro=distro, status=status, http_version=resp.http_version, requested=feed_url, delivered=final_url, headers=info_headers)
+                if status in (429, 503):
+                    rss_ok = False
+                    retry_after = _retry_after_seconds(resp.headers.get("retry-after"))
+                    if retry_after:
+                        sem_local.backoff(retry_after)
+                        debug_log("rss_retry_after", distro=distro, seconds=retry_after)
                 # If the server advertises a non-XML/RSS content-type, force playwright fallback.
                 ct = info_headers.get('Content-Type') or info_headers.get('content-type')
                 try:
-                    if ct and not re.search(r"(xml|rss)", ct, re.I):
+                    if ct and status != 304 and not _RX_XML_CT.search(ct):
                         used_playwright = True
                         debug_log("rss_content_type_mismatch", distro=distro, requested=feed_url, delivered=final_url, content_type=ct)
                 except Exception:
                     # Defensive: if header parsing fails, continue to chunked sniffing below
                     pass
-                if status != 200:
+                if status == 304 and cached_body is not None:
+                    text = cached_body
+                    debug_log("rss_cache_hit", distro=distro, feed=feed_url)
+                elif status != 200:
                     used_playwright = True
                 else:
                     # Only perform chunked parsing if header didn't already force fallback
                     if not used_playwright:
-                        buf = ""
+                        # feed chunks straight into expat and stop reading at the first match
+                        feed_parser = _make_feed_parser()
+                        chunks = []
+                        received = 0
+                        complete = False
                         async for chunk in resp.aiter_bytes(chunk_size=2048):
-                            try:
-                                chunk_text = chunk.decode()
-                            except Exception:
-                                chunk_text = chunk.decode(errors="ignore")
-                            buf += chunk_text
-                            parsed = parse_rss_text(buf)
-                            if parsed:
-                                text = buf
+                            chunks.append(chunk)
+                            received += len(chunk)
+                            if feed_parser is not None:
+                                try:
+                                    feed_parser.Parse(chunk, False)
+                                except _FeedMatch as hit:
+                                    stream_match = (hit.latest, hit.link)
+                                    break
+                                except xml.parsers.expat.ExpatError:
+                                    # not well-formed XML; keep the body for the regex fallbacks
+                                    feed_parser = None
+                            if received > _RSS_MAX_BODY:
                                 break
-                            if len(buf) > 64 * 1024:
-                                buf = buf[-32 * 1024:]
-                        if not text:
-                            text = buf
+                        else:
+                            complete = True
+                        await resp.aclose()
+                        body = b"".join(chunks)
+                        try:
+                            text = body.decode()
+                        except Exception:
+                            text = body.decode(errors="ignore")
+                        if complete:
+                            # validators only describe the full body; a prefix cut short
+                            # by an early match or the size cap isn't cached
+                            _feed_cache_store(feed_url, resp.headers, text)
                         debug_log("rss_raw_snippet", distro=distro, snippet=(text[:2000] if text else ""), content_type=ct, content_length=len(text) if text else None)
-                        if ct and 'html' in ct.lower() and not re.search(r"<(?:rss|feed|entry|item)[\s>]", text, re.I):
+                        if ct and 'html' in ct.lower() and not _RX_XML_ROOT.search(text):
                             used_playwright = True
         except Exception as e:
             debug_log("rss_http_exception", distro=distro, exc=str(e))
+            rss_ok = False
             used_playwright = True
 
+        if used_playwright and state.no_browser:
+            debug_log("rss_playwright_skipped", distro=distro, reason="no_browser")
+            return None
+
         if used_playwright:
             try:
-                browser = globals().get("playwright_rss_browser")
+                browser = state.browser
+                if browser is None and state.browser_launch is not None:
+                    # `main` starts the shared browser in the background; join that launch
+                    # (shielded, so a cancelled feed doesn't cancel it) but never cold-start
+                    try:
+                        browser = await asyncio.shield(state.browser_launch)
+                    except Exception:
+                        browser = None
                 if not browser:
-                    browser = await p.chromium.launch(headless=True)
-                    globals()["playwright_rss_browser"] = browser
+                    debug_log("rss_playwright_unavailable", distro=distro)
+                    return None
                 page = await browser.new_page()
-                await page.goto(feed_url, timeout=globals().get('timeout_ms', 20000), wait_until="domcontentloaded")
+                await page.goto(feed_url, timeout=state.timeout_ms, wait_until="domcontentloaded")
                 page_text = await page.content()
                 await page.close()
-                m = re.search(r"<div[^>]+id=[\"']webkit-xml-viewer-source-xml[\"'][^>]*>(.*?)</div>", page_text, re.S | re.I)
+                m = _RX_WEBKIT.search(page_text)
                 if m:
                     text = m.group(1)
                 else:
-                    m2 = re.search(r"<(?:rss|feed)[\s>].*", page_text, re.S | re.I)
+                    m2 = _RX_FEED_ROOT.search(page_text)
                     if m2:
                         text = m2.group(0)
                     else:
-                        text = re.sub(r"<(/?)(html|body)[^>]*>", "", page_text, flags=re.I)
+                        text = _RX_HTML_BODY.sub("", page_text)
                 # Verify the fetched feed appears to be for the requested distro.
                 try:
                     if not _rss_feed_matches_distro(text, distro):
@@ -799,13 +1217,184 @@ async def try_rss_only(p, distro, local_version):
                 debug_log("rss_playwright_error", distro=distro, exc=str(e))
                 return None
 
-        parsed = parse_rss_text(text)
+        parsed = (stream_match if not used_playwright else None) or parse_rss_text(text)
         if parsed:
             latest, link_from_feed = parsed
             debug_log("rss_prefetch_match", distro=distro, value=latest, via=("playwright" if used_playwright else "httpx"))
             debug_log("rss_prefetch_return", distro=distro, latest=latest, via="rss_try")
+            _FEED_RESULTS[feed_url] = (latest, link_from_feed or "")
+            if rss_ok is None:
+                rss_ok = True
             return latest, link_from_feed or ""
         return None
+    finally:
+        sem_local.release(rss_ok)
+
+
+async def _prefetch_one(state, distro, local_version, source, feed_url):
+    """Run try_rss_only for one distro and turn a hit into a result row.
+
+    Returns the row, or None when the browser has to take over.
+    """
+    res = await try_rss_only(state, distro, local_version, source, feed_url)
+    if not (isinstance(res, tuple) and res[0]):
+        return None
+    latest, link = res
+    lv_tuple = state.parsed_local[distro]
+    try:
+        latest_tuple = version_tuple(latest)
+    except Exception:
+        latest_tuple = ()
+    if lv_tuple == latest_tuple:
+        st = "UP TO DATE"
+    elif lv_tuple > latest_tuple:
+        st = "LOCAL AHEAD"
+    else:
+        st = "UPDATE AVAILABLE"
+    return distro, local_version, latest, st, link or "", "rss"
+
+
+async def _prefetch_rss(state, track) -> tuple[dict, list]:
+    """Resolve as many distros as possible from their feeds.
+
+    ``track`` registers the tasks a signal should cancel. Returns
+    (resolved, remaining): resolved maps distro -> result row and remaining
+    lists the (distro, local_version) pairs left for the browser.
+    """
+    # Open the distrowatch.com connection up front so the prefetch burst
+    # multiplexes onto it instead of racing to open parallel connections. It
+    # runs alongside the worker startup rather than delaying it, and is skipped
+    # when every distrowatch feed is already memoised.
+    if state.session is not None and any(
+        u.startswith("https://distrowatch.com/") and u not in _FEED_RESULTS for u in distro_feed_urls
+    ):
+        def _warm_done(t):
+            if t.cancelled():
+                debug_log("rss_prewarm_failed", error="cancelled")
+            elif t.exception() is not None:
+                debug_log("rss_prewarm_failed", error=str(t.exception()))
+            else:
+                debug_log("rss_prewarm", host="distrowatch.com")
+
+        warm = asyncio.create_task(
+            state.session.head("https://distrowatch.com/", timeout=min(5.0, state.timeout_ms / 1000.0))
+        )
+        warm.add_done_callback(_warm_done)
+        track([warm])
+
+    # prefetch all distros (RSS or Distrowatch feed) on a fixed pool of workers;
+    # each job classifies its own result as soon as its feed completes
+    pre_jobs = [
+        (state, d, v, src, url)
+        for d, v, src, url in zip(distro_names, distro_versions, distro_sources, distro_feed_urls)
+    ]
+    pre_futures, pre_workers = _start_workers(pre_jobs, _prefetch_one, rss_concurrency)
+    track(pre_workers)
+
+    monitor_pre = asyncio.create_task(_progress_bar(pre_futures, "Fetching RSS"))
+    pre_results = await asyncio.gather(*pre_futures, return_exceptions=True)
+    await asyncio.gather(*pre_workers, return_exceptions=True)
+    try:
+        await monitor_pre
+    except Exception:
+        pass
+    resolved = {}
+    remaining = []
+    # pair with the same snapshot the jobs were built from
+    for distro, lv, row in zip(distro_names, distro_versions, pre_results):
+        if isinstance(row, tuple):
+            resolved[distro] = row
+        else:
+            remaining.append((distro, lv))
+
+    # Diagnostic summary: show which distros were resolved via RSS and which remain
+    try:
+        resolved_names = sorted(list(resolved.keys()))
+        remaining_names = [d for d, _ in remaining]
+        debug_log("prefetch_summary", resolved=resolved_names, remaining=remaining_names)
+        msg = f"Resolved via RSS: {len(resolved_names)} -> {resolved_names}\n"
+        if not state.no_browser:
+            msg += f"Remaining (will use browser): {len(remaining_names)} -> {remaining_names}\n"
+        # one write so the summary can't interleave with a progress bar redraw
+        sys.stderr.write(msg)
+    except Exception:
+        pass
+
+    return resolved, remaining
+
+
+async def _fetch_browser(state, p, remaining: list, track) -> list:
+    """Load the Distrowatch pages for distros the prefetch left unresolved.
+
+    ``track`` registers the tasks a signal should cancel. Returns one fetch()
+    result (or exception) per entry in ``remaining``.
+    """
+    if state.browser is None:
+        state.browser = await p.chromium.launch(headless=True)
+    # a pool of contexts bounds concurrent pages and shares the route handler
+    ctx_queue = await _make_context_pool(state.browser, max_parallel_tabs)
+    # create tasks so we can cancel on signals
+    tasks = [
+        asyncio.create_task(fetch(state, ctx_queue, d, v))
+        for d, v in remaining
+    ]
+    track(tasks)
+    monitor_pages = asyncio.create_task(_progress_bar(tasks, "Fetching pages"))
+    browser_results = await asyncio.gather(*tasks, return_exceptions=True)
+    try:
+        await monitor_pages
+    except Exception:
+        pass
+    return browser_results
+
+
+def _format_results(results: list) -> tuple[list, list, bool, bool]:
+    """Sort and print the results table, applying the status filters.
+
+    Returns (filtered_results, urls, updates, local_ahead).
+    """
+    results.sort(key=lambda x: x[0])
+
+    updates = False
+    local_ahead = False
+
+    print("\nDistro           Local       Latest      Status")
+    print("-------------------------------------------------------------")
+
+    filtered_results = []
+    urls = []
+
+    for row in results:
+        if isinstance(row, (list, tuple)) and len(row) >= 5:
+            distro, lv, dv, status, link = row[:5]
+            src = row[5] if len(row) >= 6 else ""
+        else:
+            continue
+        if status == "UPDATE AVAILABLE":
+            updates = True
+        elif status == "LOCAL AHEAD":
+            local_ahead = True
+
+        if passes_filter(status):
+            filtered_results.append((distro, lv, dv, status, link, src))
+            if link:
+                idx = len(urls) + 1
+                urls.append(link)
+                link_display = f"  [{idx}]"
+            else:
+                link_display = ""
+
+            print(
+                f"{distro.ljust(15)}"
+                f"{lv.ljust(12)}"
+                f"{dv.ljust(12)}"
+                f"{color(status)}"
+                + link_display
+            )
+
+    return filtered_results, urls, updates, local_ahead
+
+
 async def main():
     # Ensure `resolved` exists in the function scope before any early references
     resolved = {}
@@ -814,21 +1403,67 @@ async def main():
     try:
         import time, signal
         main_start = time.monotonic()
-        async with async_playwright() as p:
+
+        # Signal handlers are installed once; tasks_ref collects every task they
+        # should cancel as the run creates them. Tasks registered through _track
+        # after a signal has already arrived are cancelled on the spot.
+        tasks_ref = []
+        cancelled = False
+
+        def _track(tasks: list) -> None:
+            tasks_ref.extend(tasks)
+            if cancelled:
+                for t in tasks:
+                    t.cancel()
+
+        loop = asyncio.get_running_loop()
+
+        def _cancel_all() -> None:
+            # first signal cancels cooperatively; the handlers are then removed so a
+            # second Ctrl-C raises KeyboardInterrupt (and SIGTERM kills) as usual,
+            # forcing the way out if a cancelled task hangs in a close
+            nonlocal cancelled
+            cancelled = True
+            pending = [t for t in tasks_ref if not t.done()]
+            debug_log("signal", msg="cancelling all tasks", pending=len(pending))
+            for t in pending:
+                t.cancel()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(sig)
+                except Exception:
+                    pass
+
+        try:
+            loop.add_signal_handler(signal.SIGINT, _cancel_all)
+            loop.add_signal_handler(signal.SIGTERM, _cancel_all)
+        except (NotImplementedError, RuntimeError):
+            # Windows loops have no add_signal_handler; Ctrl-C surfaces as
+            # KeyboardInterrupt and is handled in __main__
+            pass
+
+        async with contextlib.AsyncExitStack() as stack:
+            # Only start Playwright (Node driver + Chromium) when the browser may be used
+            p = None
+            if not no_browser:
+                from playwright.async_api import async_playwright
+
+                p = await stack.enter_async_context(async_playwright())
             # Attempt to create a shared httpx session for RSS fetching (prefer HTTP/2)
             rss_session = None
             rss_sem = None
             try:
                 import httpx
 
-                timeout = httpx.Timeout(timeout_ms / 1000.0)
+                # bound connection setup separately so a stalled handshake fails fast
+                timeout = httpx.Timeout(timeout_ms / 1000.0, connect=min(5.0, timeout_ms / 1000.0))
                 # Use a richer set of browser-like headers to reduce server-side blocking
                 headers = {
                     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                     # Prefer RSS/XML when available but accept other types as fallback
                     "Accept": "application/rss+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.7",
                     "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
+                    "Accept-Encoding": "gzip, deflate, br" if brotli is not None else "gzip, deflate",
                     "Connection": "keep-alive",
                     "Referer": "https://distrowatch.com/",
                     "DNT": "1",
@@ -844,12 +1479,45 @@ async def main():
                     "Pragma": "no-cache",
                     "Cache-Control": "no-cache",
                 }
-                # Increase connection limits and avoid honor system proxies (faster direct connections)
-                limits = httpx.Limits(max_connections=max(20, rss_concurrency * 4), max_keepalive_connections=max(10, rss_concurrency))
-                rss_session = httpx.AsyncClient(timeout=timeout, headers=headers, http2=True, limits=limits, trust_env=False)
-                rss_sem = asyncio.Semaphore(rss_concurrency)
-                globals()["rss_session"] = rss_session
-                globals()["rss_sem"] = rss_sem
+                # Increase connection limits. Keep idle connections around for the whole run
+                # so feeds on the same host reuse one TLS session (and one HTTP/2 connection)
+                # instead of reconnecting.
+                limits = httpx.Limits(
+                    max_connections=max(20, rss_concurrency * 4),
+                    max_keepalive_connections=max(10, rss_concurrency),
+                    keepalive_expiry=30.0,
+                )
+                # One SSL context for every connection so TLS sessions can be resumed.
+                # It trusts the bundled certifi store (when installed) plus the system store, and any
+                # SSL_CERT_FILE / SSL_CERT_DIR (corporate or intercepting CAs).
+                import ssl
+
+                try:
+                    import certifi
+                    ssl_ctx = ssl.create_default_context(cafile=certifi.where())
+                    ssl_ctx.load_default_certs()
+                except ImportError:
+                    ssl_ctx = ssl.create_default_context()
+                cert_file = os.environ.get("SSL_CERT_FILE") or None
+                cert_dir = os.environ.get("SSL_CERT_DIR") or None
+                if cert_file or cert_dir:
+                    try:
+                        ssl_ctx.load_verify_locations(cafile=cert_file, capath=cert_dir)
+                    except (OSError, ssl.SSLError) as e:
+                        debug_log("rss_ca_load_failed", cafile=cert_file, capath=cert_dir, error=str(e))
+                ssl_ctx.set_alpn_protocols(["h2", "http/1.1"])
+                # No explicit transport: httpx then builds the pool (and any proxy pools
+                # from HTTPS_PROXY/ALL_PROXY/NO_PROXY) with this context, HTTP/2 and limits.
+                # Its default transport doesn't retry, leaving that to our own logic.
+                rss_session = httpx.AsyncClient(
+                    timeout=timeout,
+                    headers=headers,
+                    verify=ssl_ctx,
+                    http2=True,
+                    limits=limits,
+                    trust_env=True,
+                )
+                rss_sem = AIMDSemaphore(rss_concurrency)
                 debug_log("rss_session_created", concurrency=rss_concurrency)
             except Exception as e:
                 debug_log("rss_session_unavailable", error=str(e))
@@ -858,230 +1526,114 @@ async def main():
 
                     _sys.stderr.write(f"[INFO] RSS disabled (httpx unavailable): {e}\n")
                 except Exception:
-                    try:
-                        import random
-
-                        await asyncio.sleep(random.uniform(rss_jitter_min, rss_jitter_max))
-                    except Exception:
-                        pass
-                    try:
-                        import random
-
-                        hdrs = dict(headers) if 'headers' in globals() or 'headers' in locals() else None
-                        if hdrs:
-                            ua_choices = [
-                                hdrs.get('User-Agent', ''),
-                                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0',
-                            ]
-                            hdrs['User-Agent'] = random.choice(ua_choices)
-                    except Exception:
-                        hdrs = None
-
-                    text = None
-                    used_playwright = False
+                    pass
 
-                    # duplicate RSS attempt block removed (module-level try_rss_only used instead)
+            # Launch the one shared Chromium in the background so its startup overlaps
+            # the RSS prefetch; it is only waited for if distros are left for it.
+            launch_task = None
+            if p is not None:
+                launch_task = asyncio.create_task(
+                    p.chromium.launch(headless=True, args=["--disable-dev-shm-usage"])
+                )
+                _track([launch_task])
+
+            # shared run state handed to the fetch coroutines instead of module globals
+            state = SimpleNamespace(
+                session=rss_session,
+                sem=rss_sem,
+                browser=None,
+                browser_launch=launch_task,
+                jitter=(rss_jitter_min, rss_jitter_max),
+                timeout_ms=timeout_ms,
+                overrides=overrides,
+                no_browser=no_browser,
+                # local versions parsed once; every comparison below reuses them
+                parsed_local={d: version_tuple(v) for d, v in zip(distro_names, distro_versions)},
+            )
 
-                    # Collect resolved entries from RSS prefetch
-                    resolved = {}
+            # a signal during Playwright/session startup skips the prefetch outright;
+            # every distro falls through to the "cancelled" rows below
+            if cancelled:
+                resolved, remaining = {}, list(zip(distro_names, distro_versions))
+            else:
+                resolved, remaining = await _prefetch_rss(state, _track)
 
-                    # nested try_rss_only removed (module-level implementation will be used)
+            # one row per distro; RSS-resolved rows are entered first and win the merge
+            by_distro = dict(resolved)
 
-            # build prefetch tasks for all distros (RSS or Distrowatch feed)
-            try:
-                pre_tasks = [asyncio.create_task(try_rss_only(p, d, v)) for d, v in local_versions.items()]
-            except Exception as e:
-                import traceback, sys as _sys
-                # Log whether the name is present in locals/globals (avoids directly referencing a possibly-unbound local)
-                has_in_locals = 'try_rss_only' in locals()
-                has_in_globals = 'try_rss_only' in globals()
-                debug_log("prefetch_task_creation_error", error=str(e), has_in_locals=has_in_locals, has_in_globals=has_in_globals, exc=traceback.format_exc())
-                _sys.stderr.write(f"[ERROR] prefetch task creation failed: {e}\n")
-                raise
-
-            monitor_pre = asyncio.create_task(_progress_bar(pre_tasks, "Fetching RSS"))
-            pre_results = await asyncio.gather(*pre_tasks, return_exceptions=True)
-            try:
-                await monitor_pre
-            except Exception:
-                pass
-            remaining = []
-            for (distro, lv), res in zip(local_versions.items(), pre_results):
-                if isinstance(res, tuple) and res[0]:
-                    latest, link = res
-                    lv_tuple = version_tuple(lv)
+            # If --no-browser is set, convert remaining distros to UNKNOWN and skip Playwright
+            if remaining and state.no_browser:
+                for distro, lv in remaining:
+                    by_distro[distro] = (distro, lv, "N/A", "UNKNOWN", "", "skipped_no_browser")
+                remaining = []
+            if launch_task is not None:
+                if remaining and not cancelled:
                     try:
-                        latest_tuple = version_tuple(latest)
-                    except Exception:
-                        latest_tuple = ()
-                    if lv_tuple == latest_tuple:
-                        st = "UP TO DATE"
-                    elif lv_tuple > latest_tuple:
-                        st = "LOCAL AHEAD"
-                    else:
-                        st = "UPDATE AVAILABLE"
-                    resolved[distro] = (distro, lv, latest, st, link or "", "rss")
+                        state.browser = await launch_task
+                        debug_log("playwright_browser_launched")
+                    except asyncio.CancelledError:
+                        # only swallow the launch's own cancellation (a signal), not ours
+                        if not launch_task.cancelled():
+                            raise
+                        debug_log("playwright_launch_error", error="cancelled")
+                    except Exception as e:
+                        debug_log("playwright_launch_error", error=str(e))
+                elif launch_task.done() and not launch_task.cancelled() and launch_task.exception() is None:
+                    # no page fetches follow; a browser that already came up is closed
+                    # with the session below, one still starting is abandoned
+                    state.browser = launch_task.result()
                 else:
-                    remaining.append((distro, lv))
-
-            # Diagnostic summary: show which distros were resolved via RSS and which remain
-            try:
-                resolved_names = sorted(list(resolved.keys()))
-                remaining_names = [d for d, _ in remaining]
-                debug_log("prefetch_summary", resolved=resolved_names, remaining=remaining_names)
-                import sys as _sys
-                _sys.stderr.write(f"Resolved via RSS: {len(resolved_names)} -> {resolved_names}\n")
-                if not globals().get("no_browser"):
-                    _sys.stderr.write(f"Remaining (will use browser): {len(remaining_names)} -> {remaining_names}\n")
-            except Exception:
-                pass
-
-            # If all resolved via RSS, skip launching Playwright
-            results = list(resolved.values())
-
-            # If --no-browser is set, convert remaining distros to UNKNOWN and skip Playwright
-            if remaining and globals().get("no_browser"):
+                    launch_task.cancel()
+            # Interrupted during the prefetch: report what we have, don't start the browser phase
+            if remaining and cancelled:
                 for distro, lv in remaining:
-                    results.append((distro, lv, "N/A", "UNKNOWN", "", "skipped_no_browser"))
+                    by_distro[distro] = (distro, lv, "N/A", "UNKNOWN", "", "cancelled")
                 remaining = []
 
-            tasks = []
-            browser = None
             browser_results = []
             if remaining:
-                browser = await p.chromium.launch(headless=True)
-                sem = asyncio.Semaphore(max_parallel_tabs)
-                # create tasks so we can cancel on signals
-                tasks = [
-                    asyncio.create_task(fetch(browser, d, v, sem))
-                    for d, v in remaining
-                ]
-                monitor_pages = asyncio.create_task(_progress_bar(tasks, "Fetching pages"))
-
-            loop = asyncio.get_running_loop()
-
-            def _cancel_all() -> None:
-                debug_log("signal", msg="cancelling all tasks")
-                for t in tasks:
-                    try:
-                        t.cancel()
-                    except Exception:
-                        pass
-
-            # register signal handlers (best-effort)
-            try:
-                loop.add_signal_handler(signal.SIGINT, _cancel_all)
-                loop.add_signal_handler(signal.SIGTERM, _cancel_all)
-            except Exception:
-                import signal as _signal
-
-                def _handler(sig, frame):
-                    loop.call_soon_threadsafe(_cancel_all)
-
-                _signal.signal(_signal.SIGINT, _handler)
+                browser_results = await _fetch_browser(state, p, remaining, _track)
+            # shut down the rss session and the browser concurrently; they don't depend
+            # on each other and each can take a few hundred ms
+            async def _close_session() -> None:
+                if not rss_session:
+                    return
                 try:
-                    _signal.signal(_signal.SIGTERM, _handler)
-                except Exception:
-                    pass
-
-            if tasks:
-                browser_results = await asyncio.gather(*tasks, return_exceptions=True)
+                    await rss_session.aclose()
+                    debug_log("rss_session_closed")
+                except Exception as e:
+                    debug_log("rss_session_close_error", error=str(e))
+
+            async def _close_browser() -> None:
+                if not state.browser:
+                    return
                 try:
-                    await monitor_pages
-                except Exception:
-                    pass
-            if browser:
-                await browser.close()
-            # close shared rss session if created
-            try:
-                if rss_session:
-                    try:
-                        if hasattr(rss_session, "aclose"):
-                            await rss_session.aclose()
-                        elif hasattr(rss_session, "close"):
-                            rss_session.close()
-                        debug_log("rss_session_closed")
-                    except Exception as _e:
-                        debug_log("rss_session_close_error", error=str(_e))
-            except Exception as e:
-                debug_log("rss_session_close_error", error=str(e))
-            finally:
-                globals().pop("rss_session", None)
-                globals().pop("rss_sem", None)
-            # close any playwright browser created for RSS fetching
-            try:
-                br = globals().pop("playwright_rss_browser", None)
-                if br:
-                    await br.close()
+                    await state.browser.close()
                     debug_log("playwright_rss_browser_closed")
-            except Exception as e:
-                debug_log("playwright_rss_browser_close_error", error=str(e))
-            finally:
-                # remove legacy keys if present
-                globals().pop("playwright_browser", None)
-                globals().pop("playwright_instance", None)
+                except Exception as e:
+                    debug_log("playwright_rss_browser_close_error", error=str(e))
+
+            await asyncio.gather(_close_session(), _close_browser())
             # merge any browser results with the RSS-resolved results
-            if browser_results:
-                for r in browser_results:
-                    if isinstance(r, Exception):
-                        # mark that some tasks failed while others may have succeeded
-                        partial_other = True
-                        debug_log("task_exception", exc=str(r))
-                        continue
-                    # prefer prefetch/resolved entries (RSS) — skip browser result
-                    try:
-                        distro_name = r[0]
-                    except Exception:
-                        results.append(r)
-                        continue
-                    if distro_name in resolved:
-                        debug_log("merge_skip", distro=distro_name, reason="already_resolved_via_rss")
-                        continue
-                    results.append(r)
+            for r in browser_results:
+                # fetch() always returns a 6-tuple; anything else is an exception,
+                # including CancelledError from a signal
+                if isinstance(r, BaseException):
+                    # mark that some tasks failed while others may have succeeded
+                    partial_other = True
+                    debug_log("task_exception", exc=repr(r))
+                    continue
+                # prefer prefetch/resolved entries (RSS) — skip browser result
+                if by_distro.setdefault(r[0], r) is not r:
+                    debug_log("merge_skip", distro=r[0], reason="already_resolved_via_rss")
+            results = list(by_distro.values())
     except Exception as e:
         print(f"[ERROR] Playwright failure: {e}")
         import traceback
         debug_log("playwright_error", error=str(e), exc=traceback.format_exc())
         return EXIT_FATAL, []
 
-    results.sort(key=lambda x: x[0])
-
-    updates = False
-    local_ahead = False
-
-    print("\nDistro           Local       Latest      Status")
-    print("-------------------------------------------------------------")
-
-    filtered_results = []
-    urls = []
-
-    for row in results:
-        if isinstance(row, (list, tuple)) and len(row) >= 5:
-            distro, lv, dv, status, link = row[:5]
-            src = row[5] if len(row) >= 6 else ""
-        else:
-            continue
-        if status == "UPDATE AVAILABLE":
-            updates = True
-        elif status == "LOCAL AHEAD":
-            local_ahead = True
-
-        if passes_filter(status):
-            filtered_results.append((distro, lv, dv, status, link, src))
-            if link:
-                idx = len(urls) + 1
-                urls.append(link)
-                link_display = f"  [{idx}]"
-            else:
-                link_display = ""
-
-            print(
-                f"{distro.ljust(15)}"
-                f"{lv.ljust(12)}"
-                f"{dv.ljust(12)}"
-                f"{color(status)}"
-                + link_display
-            )
+    filtered_results, urls, updates, local_ahead = _format_results(results)
 
     # If user only asked for URLs, print them one-per-line and exit
     if urls_only:
@@ -1105,9 +1657,8 @@ async def main():
             writer.writerow(
                 ["distro", "local_version", "latest_version", "status", "distrowatch_url", "source"]
             )
-            for row in filtered_results:
-                # row may include source as sixth element
-                writer.writerow([row[0], row[1], row[2], row[3], row[4], row[5] if len(row) > 5 else ""])
+            # filtered rows are already (distro, lv, dv, status, link, source)
+            writer.writerows(filtered_results)
 
     # JSON
     if json_output:
@@ -1118,18 +1669,17 @@ async def main():
             2 if local_ahead else
             0
         )
-        list_of_results = []
-        for row in filtered_results:
-            d, lv, dv, st, link = row[:5]
-            src = row[5] if len(row) > 5 else ""
-            list_of_results.append({
+        list_of_results = [
+            {
                 "distro": d,
                 "local_version": lv,
                 "latest_version": dv,
                 "status": st,
                 "distrowatch_url": link,
                 "source": src,
-            })
+            }
+            for d, lv, dv, st, link, src in filtered_results
+        ]
         data = {
             "summary": {
                 "updates_available": updates,
@@ -1138,8 +1688,12 @@ async def main():
             },
             "results": list_of_results,
         }
-        with open(json_output, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            with open(json_output, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_output, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
 
     debug_log("total_runtime", total=(__import__("time").monotonic() - main_start))
 
@@ -1148,7 +1702,7 @@ async def main():
     any_successful = any(r[3] != "UNKNOWN" for r in results)
     has_network_all = network_unknowns and not any_successful
     has_network_partial = network_unknowns and any_successful
-    has_config = bool(globals().get("config_partial_issues"))
+    has_config = bool(config_partial_issues)
     has_other = bool(partial_other)
 
     # Multiple-issue handling:
@@ -1176,78 +1730,82 @@ async def main():
 def _parse_selection(s: str, max_idx: int) -> list[int]:
     out = set()
     for part in s.split(','):
-        part = part.strip()
-        if not part:
+        m = _RX_SEL.fullmatch(part)
+        if not m:
             continue
-        if '-' in part:
-            try:
-                a, b = part.split('-', 1)
-                a = int(a)
-                b = int(b)
-            except Exception:
-                continue
-            if a > b:
-                a, b = b, a
-            for i in range(max(1, a), min(b, max_idx) + 1):
-                out.add(i)
-        else:
-            try:
-                v = int(part)
-            except Exception:
-                continue
-            if 1 <= v <= max_idx:
-                out.add(v)
+        a = int(m.group(1))
+        b = int(m.group(2)) if m.group(2) else a
+        if a > b:
+            a, b = b, a
+        out.update(range(max(1, a), min(b, max_idx) + 1))
     return sorted(out)
 
 
+def _edit_line(buf: str, chars: str, erase: str) -> tuple[str, str, str | None]:
+    """Apply a burst of keystrokes to the selection buffer.
+
+    Returns (buf, echo, end) where echo is what to write back to the terminal
+    and end is '\n' for Enter, '\x1b' for ESC or None if input continues.
+    """
+    echo = []
+    for ch in chars:
+        if ch == '\r' or ch == '\n':
+            return buf, ''.join(echo), '\n'
+        if ch == '\x1b':
+            return buf, ''.join(echo), '\x1b'
+        if ch == erase:
+            if buf:
+                buf = buf[:-1]
+                echo.append('\b \b')
+            continue
+        if ch.isprintable():
+            buf += ch
+            echo.append(ch)
+    return buf, ''.join(echo), None
+
+
 def _read_selection_line() -> str | None:
+    # Keys are read in bursts (a paste arrives as one) and echoed with a single write
     try:
         if os.name == 'nt':
             import msvcrt
 
             buf = ''
             while True:
-                ch = msvcrt.getwch()
-                if ch == '\r' or ch == '\n':
+                chars = [msvcrt.getwch()]
+                while msvcrt.kbhit():
+                    chars.append(msvcrt.getwch())
+                buf, echo, end = _edit_line(buf, ''.join(chars), '\x08')
+                if echo:
+                    sys.stdout.write(echo)
+                    sys.stdout.flush()
+                if end == '\x1b':
+                    return None
+                if end:
                     print()
                     return buf
-                if ch == '\x1b':
-                    return None
-                if ch == '\x08':
-                    if buf:
-                        buf = buf[:-1]
-                        sys.stdout.write('\b \b')
-                        sys.stdout.flush()
-                    continue
-                if ch.isprintable():
-                    buf += ch
-                    sys.stdout.write(ch)
-                    sys.stdout.flush()
         else:
-            import sys as _sys, tty, termios
+            import codecs, tty, termios
 
-            fd = _sys.stdin.fileno()
+            fd = sys.stdin.fileno()
             old = termios.tcgetattr(fd)
+            decoder = codecs.getincrementaldecoder(sys.stdin.encoding or 'utf-8')(errors='replace')
             try:
                 tty.setraw(fd)
                 buf = ''
                 while True:
-                    ch = _sys.stdin.read(1)
-                    if ch == '\r' or ch == '\n':
-                        print()
-                        return buf
-                    if ch == '\x1b':
+                    data = os.read(fd, 4096)
+                    if not data:
                         return None
-                    if ch == '\x7f':
-                        if buf:
-                            buf = buf[:-1]
-                            sys.stdout.write('\b \b')
-                            sys.stdout.flush()
-                        continue
-                    if ch.isprintable():
-                        buf += ch
-                        sys.stdout.write(ch)
+                    buf, echo, end = _edit_line(buf, decoder.decode(data), '\x7f')
+                    if echo:
+                        sys.stdout.write(echo)
                         sys.stdout.flush()
+                    if end == '\x1b':
+                        return None
+                    if end:
+                        print()
+                        return buf
             finally:
                 termios.tcsetattr(fd, termios.TCSADRAIN, old)
     except Exception:
@@ -1259,7 +1817,7 @@ def _read_selection_line() -> str | None:
 
 def _interactive_exit(links: list[str] | None = None, prompt: str | None = None) -> None:
     # Respect global no_pause flag
-    if globals().get("no_pause"):
+    if no_pause:
         return
 
     links = links or []
@@ -1295,6 +1853,13 @@ def _interactive_exit(links: list[str] | None = None, prompt: str | None = None)
 
 
 if __name__ == "__main__":
+    # uvloop where available; Windows keeps the default selector/proactor loop
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
     try:
         exit_code, links = asyncio.run(main())
     except SystemExit as e:
@@ -7,8 +7,13 @@ with `--no-pause --json <tmpfile>` and renders the resulting JSON in a table.
 """
 from __future__ import annotations
 
+import codecs
+import contextlib
 import json
-import subprocess
+import locale
+from operator import itemgetter
+import queue
+import re
 import threading
 import tempfile
 import sys
@@ -22,6 +27,47 @@ from tkinter import messagebox
 
 DISPROBE = Path(__file__).resolve().parent / "disprobe.py"
 
+# stderr is read in chunks and split into lines on \r (progress redraws) or \n
+_READ_CHUNK = 4096
+_LINE_SPLIT_RE = re.compile(r"[\r\n]")
+# "Fetching RSS: [###----] 3/10" or "Fetching pages: [...] 2/8"
+_PROG_RE = re.compile(r"(Fetching RSS|Fetching pages)[: ].*?(\d+)/(\d+)")
+# the debug pane keeps at most _DEBUG_MAX_LINES; past that it drops back to
+# the newest _DEBUG_KEEP_LINES so trimming happens once per ~1000 lines
+_DEBUG_MAX_LINES = 5000
+_DEBUG_KEEP_LINES = 4000
+
+# Results table columns: tuned widths for readability; the header canvas draws
+# the dividers between them
+_COL_WIDTHS = {
+    "distro": 180,
+    "local": 120,
+    "latest": 120,
+    "status": 140,
+    "source": 220,
+}
+# result dict keys in table column order; legacy tuple rows keep the same
+# fields at positions 0-3 and 5 (4 is the URL)
+_RESULT_FIELDS = ("distro", "local_version", "latest_version", "status", "source")
+_LEGACY_FIELDS = itemgetter(0, 1, 2, 3, 5)
+# disprobe status (uppercased) -> Treeview tag; anything else is "st_unknown"
+_ST_TAG = {
+    "UP TO DATE": "st_up_to_date",
+    "UPDATE AVAILABLE": "st_update_available",
+    "LOCAL AHEAD": "st_local_ahead",
+}
+# status foreground colours per theme; UNKNOWN uses the theme's text colour
+_ST_COLORS_DARK = {
+    "UP TO DATE": "#00FFFF",          # cyan
+    "UPDATE AVAILABLE": "#FFF59D",   # light yellow
+    "LOCAL AHEAD": "#FF77FF",        # light magenta
+}
+_ST_COLORS_LIGHT = {
+    "UP TO DATE": "#008B8B",         # darker cyan
+    "UPDATE AVAILABLE": "#B28700",  # darker yellow/gold
+    "LOCAL AHEAD": "#9A00A8",       # darker magenta/purple
+}
+
 try:
     import ttkbootstrap as tb
     from ttkbootstrap.constants import INFO, SUCCESS, DANGER
@@ -29,6 +75,32 @@ try:
 except Exception:
     USE_TTB = False
 
+# Optional incremental JSON parser for the results file
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional fast JSON parser for the debug lines streamed on stderr
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+
+def _parse_debug_line(line: str) -> dict | None:
+    """Return the disprobe debug_log payload carried by a stderr line, or None."""
+    # progress bars and plain messages never start with '{'; skip the parse attempt
+    if not line.startswith("{"):
+        return None
+    try:
+        j = _loads(line)
+    except Exception:
+        return None
+    return j if isinstance(j, dict) and "event" in j else None
+
 
 # Detect OS theme (dark/light) if `darkdetect` is available. Best-effort only.
 IS_DARK = False
@@ -60,6 +132,11 @@ class SimpleScrollbar(tk.Canvas):
         self._last = 1.0
         self._drag = False
         self._drag_offset = 0
+        # trough and thumb are created once and moved with coords() on every redraw
+        self._trough_id = self.create_rectangle(0, 0, 1, 1, fill=self['bg'], outline=self['bg'])
+        self._thumb_id = self.create_rectangle(0, 0, 1, 1, fill=self._get_thumb_color(), outline='')
+        self._trough_color = self['bg']
+        self._thumb_color_drawn = self._get_thumb_color()
         self.bind('<Button-1>', self._on_click)
         self.bind('<B1-Motion>', self._on_drag)
         self.bind('<ButtonRelease-1>', self._on_release)
@@ -74,23 +151,25 @@ class SimpleScrollbar(tk.Canvas):
         self._draw()
 
     def _draw(self):
-        self.delete('all')
         w = self.winfo_width()
         h = self.winfo_height()
+        bg = self['bg']
+        if bg != self._trough_color:
+            self._trough_color = bg
+            self.itemconfigure(self._trough_id, fill=bg, outline=bg)
+        thumb = self._get_thumb_color()
+        if thumb != self._thumb_color_drawn:
+            self._thumb_color_drawn = thumb
+            self.itemconfigure(self._thumb_id, fill=thumb)
+        self.coords(self._trough_id, 0, 0, w, h)
         if self.orient == 'vertical':
-            trough_coords = (0, 0, w, h)
-            self.create_rectangle(*trough_coords, fill=self['bg'], outline=self['bg'])
             fh = max(10, int((self._last - self._first) * h))
             y1 = int(self._first * h)
-            y2 = y1 + fh
-            self.create_rectangle(2, y1, w-2, y2, fill=self._get_thumb_color(), outline='')
+            self.coords(self._thumb_id, 2, y1, w-2, y1 + fh)
         else:
-            trough_coords = (0, 0, w, h)
-            self.create_rectangle(*trough_coords, fill=self['bg'], outline=self['bg'])
             fw = max(10, int((self._last - self._first) * w))
             x1 = int(self._first * w)
-            x2 = x1 + fw
-            self.create_rectangle(x1, 2, x2, h-2, fill=self._get_thumb_color(), outline='')
+            self.coords(self._thumb_id, x1, 2, x1 + fw, h-2)
 
     def _get_thumb_color(self):
         return getattr(self, '_thumb_color', '#888888')
@@ -164,11 +243,33 @@ class DisprobeGUI:
         # placeholders; actual widgets created in the rss_row so they share one line
         self.status_lbl = None
         self.exit_lbl = None
-
-        self.run_btn = ttk.Button(self.top, text="Run disprobe", command=self.start)
+        # created further down (or after the first apply_theme); None until then
+        # so callers test `is not None` instead of probing with hasattr/getattr
+        self.header_canvas = None
+        self.v_scroll = None
+        self.bot = None
+        self.raw_btn = None
+        self.debug_btn = None
+        self.open_cfg_btn = None
+        # raw/debug Text panes are built on first use (see _text_pane); the raw
+        # pane is filled from _raw_data only when shown, debug lines queue in a list
+        self.raw = None
+        self.debug = None
+        self._raw_data = None
+        self._raw_rendered = True
+        self._debug_pending = []
+        self._text_bg = None
+        # key of the last palette apply_theme pushed into the styles
+        self._applied_theme_key = None
+        # (method, style name) -> options last sent through _style_call
+        self._style_cache = {}
+        # tree tag -> options last applied by _init_tree_tags/apply_theme
+        self._tag_opts = {}
+
+        self.run_btn = ttk.Button(self.top, text="Run disprobe", command=self.start, style="App.TButton")
         # Run button will be placed in the bottom-right; do not pack here.
         # Settings button created but moved to bottom next to Open config
-        self.settings_btn = ttk.Button(self.top, text="Settings", command=self.open_settings)
+        self.settings_btn = ttk.Button(self.top, text="Settings", command=self.open_settings, style="App.TButton")
 
         # Determinate progress bars with labels
         # RSS row: label on the left, status/exit on the right (same line)
@@ -195,44 +296,44 @@ class DisprobeGUI:
         self.pages_prog = ttk.Progressbar(self.frame, mode="determinate", maximum=1)
         self.pages_prog.pack(fill="x", pady=(2, 6))
 
-        # Table with monospace font, scrollbars, and alternating row colors
-        # Insert narrow separator columns between main columns to show vertical separators
-        cols = ("distro", "sep1", "local", "sep2", "latest", "sep3", "status", "sep4", "source")
+        # Table with monospace font, scrollbars, and status-coloured rows
+        # one Treeview column per field; vertical dividers live on the header canvas
+        cols = ("distro", "local", "latest", "status", "source")
+        self._cols = cols
         self.tree_frame = ttk.Frame(self.frame)
         self.tree_frame.pack(fill="both", expand=True, pady=(8, 0))
 
+        # The tree is virtualized: all result rows live in self._rows and only the
+        # slice that fits on screen is inserted. The scrollbar drives that window.
+        self._rows: list[tuple] = []
+        self._row_tags: list[str] = []
+        self._view_first = 0
+        self._rowheight = 20
+        # iid -> (values, tags) of what the tree currently shows; iids are
+        # distro names so a re-run or scroll only touches rows that changed
+        self._shown: dict[str, tuple] = {}
+
         # Use OS default fonts; keep a slightly larger row height for readability
         style = ttk.Style()
         try:
-            style.configure("Treeview", rowheight=20)
+            self._configure_if_changed(style, "Treeview", rowheight=self._rowheight)
         except Exception:
             pass
 
         # hide built-in Treeview headings; we draw our own header above the tree
         self.tree = ttk.Treeview(self.tree_frame, columns=cols, show="", height=18)
         for c in cols:
-            if c.startswith("sep"):
-                # separator column: narrow and centered; heading left empty
-                self.tree.heading(c, text="")
-                # increase width to ensure visibility across themes
-                self.tree.column(c, width=12, minwidth=8, anchor="center", stretch=False)
-                continue
-            # tuned widths for readability
-            w = {
-                "distro": 180,
-                "local": 120,
-                "latest": 120,
-                "status": 140,
-                "source": 220,
-            }.get(c, 120)
             self.tree.heading(c, text=c.capitalize())
-            self.tree.column(c, width=w, anchor="w", stretch=True)
+            self.tree.column(c, width=_COL_WIDTHS.get(c, 120), anchor="w", stretch=True)
 
         # Scrollbars
         # Use a custom Canvas scrollbar so colors can be controlled reliably
-        self.v_scroll = SimpleScrollbar(self.tree_frame, orient="vertical", command=self.tree.yview, bg="#f0f0f0")
-        # no horizontal scrollbar: tree will auto-wrap / columns sized to avoid horizontal scrolling
-        self.tree.configure(yscrollcommand=self.v_scroll.set, xscrollcommand=lambda *a: None)
+        self.v_scroll = SimpleScrollbar(self.tree_frame, orient="vertical", command=self._virtual_yview, bg="#f0f0f0")
+        # no horizontal scrollbar: columns are sized to avoid horizontal scrolling,
+        # so the tree gets no xscrollcommand at all
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", self._on_wheel)
+        self.tree.bind("<Button-5>", self._on_wheel)
         # create a header canvas above the Treeview to render column headers and separators
         self.header_canvas = tk.Canvas(self.tree_frame, height=26, highlightthickness=0, bd=0)
         try:
@@ -247,105 +348,92 @@ class DisprobeGUI:
 
         # (Previous canvas-based separator overlay removed)
 
-        # alternating row colors for readability and matching foreground
-        if IS_DARK:
-            odd_bg = "#252525"
-            even_bg = "#202020"
-            fg = "#ffffff"
-        else:
-            odd_bg = "#ffffff"
-            even_bg = "#f7f7f7"
-            fg = "#000000"
+        # text colour matching the theme; rows take the Treeview style background
+        fg = "#ffffff" if IS_DARK else "#000000"
         try:
             # assign to instance so header drawing can use it
             self.fg = fg
             # force Treeview text color to match the chosen fg (helps ttkbootstrap themes)
             try:
-                style.configure("Treeview", foreground=self.fg)
-                style.configure("Treeview.Heading", foreground=self.fg)
+                self._configure_if_changed(style, "Treeview", foreground=self.fg)
+                self._configure_if_changed(style, "Treeview.Heading", foreground=self.fg)
                 # ensure heading uses same color in active/pressed states
-                style.map("Treeview.Heading", foreground=[("active", self.fg), ("!disabled", self.fg)])
+                self._map_if_changed(style, "Treeview.Heading", foreground=[("active", self.fg), ("!disabled", self.fg)])
             except Exception:
                 pass
-            # odd/even tags only control background so status tags can set foreground
-            self.tree.tag_configure("odd", background=odd_bg)
-            self.tree.tag_configure("even", background=even_bg)
+            self._init_tree_tags()
         except Exception:
             pass
 
         # draw a custom header row on the header_canvas so separators and headers
         # render consistently across themes
-        self.header_canvas = getattr(self, 'header_canvas', None)
-        def _draw_header(event=None):
-            try:
-                # we will draw left-justified header text and separator lines
-                if not self.header_canvas:
-                    return
-                self.header_canvas.delete("all")
-                cols = self.tree['columns']
-                x = 0
-                h = int(self.header_canvas.winfo_height() or 26)
-                pad = 6
-                for i, c in enumerate(cols):
-                    w = int(self.tree.column(c, option='width') or 0)
-                    if c.startswith('sep'):
-                        xpos = x + (w // 2)
-                        self.header_canvas.create_line(xpos, 4, xpos, h-4, fill=self.fg, width=1)
-                    else:
-                        # left-justify text inside column
-                        xpos = x + pad
-                        text = c.capitalize()
-                        self.header_canvas.create_text(xpos, h//2, text=text, fill=self.fg, font=(None, 10, 'bold'), anchor='w')
-                    x += w
-            except Exception:
-                pass
+        # header items are created once and repositioned on redraw: a text item per
+        # column and a divider line before every column but the first
+        self._hdr_items = {}
+        self._hdr_seps = []
+        self._hdr_fg = None
+        self._hdr_after = None
+        self._last_hdr_w = 0
+        self._last_header_geom = None
+        # column widths in display order, refreshed only when the tree width changes
+        self._col_widths: dict[str, int] = {}
+        try:
+            for c in cols:
+                self._hdr_items[c] = self.header_canvas.create_text(
+                    0, 0, text=c.capitalize(), font=(None, 10, 'bold'), anchor='w'
+                )
+            self._hdr_seps = [
+                self.header_canvas.create_line(0, 0, 0, 0, width=1) for _ in cols[1:]
+            ]
+        except Exception:
+            pass
 
         # register bindings to redraw header
-        self.tree.bind('<Configure>', _draw_header)
-        self.root.bind('<Configure>', _draw_header)
-        self.root.after(100, _draw_header)
+        self.tree.bind('<Configure>', self._schedule_header)
+        # a resize changes how many rows fit, so refill the visible window
+        self.tree.bind('<Configure>', lambda e: self._render_rows(), add="+")
+        self.root.bind('<Configure>', self._schedule_header)
+        self.root.after(100, self._do_draw_header)
         # apply initial theme and draw header immediately
         try:
             self.apply_theme()
         except Exception:
             pass
         try:
-            _draw_header()
+            self._do_draw_header()
         except Exception:
             pass
 
         # Raw JSON view toggle + bottom controls
         self.bot = ttk.Frame(self.frame)
         self.bot.pack(fill="x", pady=(8, 0))
-        self.raw_btn = ttk.Button(self.bot, text="Show Raw JSON", command=self.toggle_raw)
+        self.raw_btn = ttk.Button(self.bot, text="Show Raw JSON", command=self.toggle_raw, style="App.TButton")
         self.raw_btn.pack(side="left")
-        self.debug_btn = ttk.Button(self.bot, text="Show Debug", command=self.toggle_debug)
+        self.debug_btn = ttk.Button(self.bot, text="Show Debug", command=self.toggle_debug, style="App.TButton")
         self.debug_btn.pack(side="left", padx=(8,0))
-        self.open_cfg_btn = ttk.Button(self.bot, text="Open distros.txt", command=self.open_config)
+        self.open_cfg_btn = ttk.Button(self.bot, text="Open distros.txt", command=self.open_config, style="App.TButton")
         self.open_cfg_btn.pack(side="left", padx=(8, 0))
         # Settings placed next to Open config
-        self.settings_btn = ttk.Button(self.bot, text="Settings", command=self.open_settings)
+        self.settings_btn = ttk.Button(self.bot, text="Settings", command=self.open_settings, style="App.TButton")
         self.settings_btn.pack(side="left", padx=(8, 0))
         # Run button on bottom-right
-        self.run_btn = ttk.Button(self.bot, text="Run disprobe", command=self.start)
+        self.run_btn = ttk.Button(self.bot, text="Run disprobe", command=self.start, style="App.TButton")
         self.run_btn.pack(side="right")
 
         # status_frame was moved to the rss_row to appear on the same line
         # as the 'Fetching RSS' label; ensure exit_lbl exists as an attribute
         try:
             # if not already created at top, create here for safety
-            if not getattr(self, 'exit_lbl', None):
+            if self.exit_lbl is None:
                 self.exit_lbl = ttk.Label(self.top, text="Exit: -")
         except Exception:
             pass
 
-        self.raw = tk.Text(self.frame, height=12)
-        self.raw.pack(fill="both", expand=False)
-        self.raw.pack_forget()
-
-        self.debug = tk.Text(self.frame, height=12)
-        self.debug.pack(fill="both", expand=False)
-        self.debug.pack_forget()
+        # The reader thread never touches Tk: it posts ("progress", key, done, total),
+        # ("debug", line) and ("done", exit_code, data) events here, and _pump applies
+        # them on the Tk thread about 30 times a second while a run is active.
+        self._evt_q = queue.SimpleQueue()
+        self._pump_after = None
 
         self.tmp_json = Path(tempfile.gettempdir()) / "disprobe_results.json"
         # settings persistence: when frozen prefer exe location (use argv[0] to
@@ -361,14 +449,162 @@ class DisprobeGUI:
         self.settings_path = exe_dir / "gui_settings.json"
         self._load_settings()
 
+    def _schedule_header(self, event=None):
+        # Configure events arrive in bursts while the window is dragged or resized;
+        # skip ones that don't change the tree width and redraw once things settle
+        if event is not None and event.widget is self.tree and event.width == self._last_hdr_w:
+            return
+        if self._hdr_after is not None:
+            self.root.after_cancel(self._hdr_after)
+        self._hdr_after = self.root.after(50, self._do_draw_header)
+
+    def _do_draw_header(self):
+        # draw left-justified header text and separator lines over the tree columns
+        self._hdr_after = None
+        try:
+            if self.header_canvas is None:
+                return
+            canvas = self.header_canvas
+            tree_w = self.tree.winfo_width()
+            h = int(canvas.winfo_height() or 26)
+            # the root <Configure> binding fires for every child widget; nothing to do
+            # unless the geometry or the theme colour actually moved
+            geom = (tree_w, h)
+            if geom == self._last_header_geom and self._hdr_fg == self.fg:
+                return
+            self._last_header_geom = geom
+            if tree_w != self._last_hdr_w or not self._col_widths:
+                self._last_hdr_w = tree_w
+                self._col_widths = {
+                    c: int(self.tree.column(c, option='width') or 0) for c in self._cols
+                }
+            if self._hdr_fg != self.fg:
+                self._hdr_fg = self.fg
+                for item in (*self._hdr_items.values(), *self._hdr_seps):
+                    canvas.itemconfigure(item, fill=self.fg)
+            x = 0
+            pad = 6
+            seps = self._hdr_seps
+            for i, (c, w) in enumerate(self._col_widths.items()):
+                if i and i <= len(seps):
+                    canvas.coords(seps[i - 1], x, 4, x, h-4)
+                item = self._hdr_items.get(c)
+                if item is not None:
+                    # left-justify text inside column
+                    canvas.coords(item, x + pad, h//2)
+                x += w
+        except Exception:
+            pass
+
+    def _visible_rows(self) -> int:
+        h = self.tree.winfo_height()
+        # before the first layout the widget reports 1px; fall back to its height option
+        if h <= 1:
+            return int(self.tree.cget("height"))
+        return max(1, h // self._rowheight)
+
+    def _render_rows(self):
+        """Insert only the rows that fit in the tree, starting at self._view_first."""
+        total = len(self._rows)
+        visible = self._visible_rows()
+        first = max(0, min(self._view_first, total - visible))
+        self._view_first = first
+        rows, row_tags = self._rows, self._row_tags
+        want = {}
+        for i in range(first, min(first + visible, total)):
+            iid = rows[i][0] or f"#{i}"
+            if iid in want:
+                iid = f"{iid}#{i}"
+            want[iid] = i
+        shown = self._shown
+        new_shown = {}
+        with self._suspend_redraw(self.tree):
+            # go straight to the Tcl command; Treeview.insert/item re-flatten their
+            # keyword options on every call
+            call, path = self.tree.tk.call, str(self.tree)
+            stale = [iid for iid in shown if iid not in want]
+            if stale:
+                call(path, "delete", stale)
+            for pos, (iid, i) in enumerate(want.items()):
+                vals, tags = rows[i], row_tags[i]
+                old = shown.get(iid)
+                if old is None:
+                    try:
+                        call(path, "insert", "", pos, "-id", iid, "-values", vals, "-tags", tags)
+                    except Exception:
+                        call(path, "insert", "", pos, "-id", iid, "-values", vals)
+                        # record it untagged so the next diff retries the tags
+                        new_shown[iid] = (vals, ())
+                        continue
+                else:
+                    if old != (vals, tags):
+                        call(path, "item", iid, "-values", vals, "-tags", tags)
+                    call(path, "move", iid, "", pos)
+                new_shown[iid] = (vals, tags)
+        self._shown = new_shown
+        if total:
+            self.v_scroll.set(first / total, min(first + visible, total) / total)
+        else:
+            self.v_scroll.set(0.0, 1.0)
+
+    @contextlib.contextmanager
+    def _suspend_redraw(self, tree):
+        """Hide a Treeview's columns while it is repopulated so it lays out once."""
+        saved = tree.cget("displaycolumns")
+        tree.configure(displaycolumns=())
+        try:
+            yield
+        finally:
+            tree.configure(displaycolumns=saved)
+            tree.yview_moveto(0)
+
+    def _virtual_yview(self, *args):
+        # same protocol as Treeview.yview: ('moveto', frac) or ('scroll', n, 'units'|'pages')
+        total = len(self._rows)
+        if not args or not total:
+            return
+        if args[0] == "moveto":
+            first = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = self._visible_rows() if args[2] == "pages" else 1
+            first = self._view_first + int(args[1]) * step
+        else:
+            return
+        if first != self._view_first:
+            self._view_first = first
+            self._render_rows()
+
+    def _on_wheel(self, event):
+        if event.num == 4:
+            delta = -1
+        elif event.num == 5:
+            delta = 1
+        else:
+            delta = -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+        self._virtual_yview("scroll", delta, "units")
+        return "break"
+
+    def _text_pane(self, initial: str = "") -> tk.Text:
+        txt = tk.Text(self.frame, height=12)
+        if self._text_bg is not None:
+            try:
+                txt.configure(bg=self._text_bg, fg=self.fg)
+            except Exception:
+                pass
+        if initial:
+            txt.insert("1.0", initial)
+        return txt
+
     def toggle_raw(self):
+        if self.raw is None:
+            self.raw = self._text_pane()
         if self.raw.winfo_ismapped():
             self.raw.pack_forget()
             self.raw_btn.config(text="Show Raw JSON")
         else:
             # hide debug pane if visible
             try:
-                if self.debug.winfo_ismapped():
+                if self.debug is not None and self.debug.winfo_ismapped():
                     self.debug.pack_forget()
                     try:
                         self.debug_btn.config(text="Show Debug")
@@ -376,17 +612,37 @@ class DisprobeGUI:
                         pass
             except Exception:
                 pass
+            self._ensure_raw_rendered()
             self.raw.pack(fill="both", expand=False)
             self.raw_btn.config(text="Hide Raw JSON")
 
+    def _ensure_raw_rendered(self):
+        # pretty-printing a large result set is only worth it once someone looks
+        if self._raw_rendered or self.raw is None:
+            return
+        data = self._raw_data
+        if data is None:
+            pretty = ""
+        else:
+            try:
+                pretty = json.dumps(data, indent=2)
+            except Exception:
+                pretty = str(data)
+        self.raw.delete("1.0", "end")
+        self.raw.insert("1.0", pretty)
+        self._raw_rendered = True
+
     def toggle_debug(self):
+        if self.debug is None:
+            self.debug = self._text_pane("".join(f"{ln}\n" for ln in self._debug_pending))
+            self._debug_pending = []
         if self.debug.winfo_ismapped():
             self.debug.pack_forget()
             self.debug_btn.config(text="Show Debug")
         else:
             # hide raw pane if visible
             try:
-                if self.raw.winfo_ismapped():
+                if self.raw is not None and self.raw.winfo_ismapped():
                     self.raw.pack_forget()
                     try:
                         self.raw_btn.config(text="Show Raw JSON")
@@ -419,10 +675,15 @@ class DisprobeGUI:
             pass
         self.status_var.set("Running...")
         # clear table
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        self.raw.delete("1.0", "end")
-
+        self._rows = []
+        self._row_tags = []
+        self._view_first = 0
+        self._render_rows()
+        self._set_raw_data(None)
+
+        # the pump only runs while there is a reader thread to drain
+        if self._pump_after is None:
+            self._pump_after = self.root.after(50, self._pump)
         t = threading.Thread(target=self._run_subprocess, daemon=True)
         t.start()
 
@@ -517,10 +778,15 @@ class DisprobeGUI:
         except Exception:
             pass
 
+        # subprocess/selectors are only needed once a run starts, so they are
+        # imported here rather than at GUI startup
+        import selectors
+        import subprocess
+
         # start subprocess and stream stderr to capture textual progress bars
-        import re, io
         # On Windows, suppress console windows for subprocesses when possible
-        popen_kwargs = dict(stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
+        # pipes stay binary and unbuffered; stderr is decoded per chunk below
+        popen_kwargs = dict(stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
         if os.name == 'nt':
             try:
                 popen_kwargs['creationflags'] = subprocess.CREATE_NO_WINDOW
@@ -529,66 +795,83 @@ class DisprobeGUI:
         proc = subprocess.Popen(args, **popen_kwargs)
 
         stderr_buf = ""
+        # the child writes in the locale encoding, same as text=True would decode
+        encoding = locale.getpreferredencoding(False) or "utf-8"
+
+        def read_rest(stream) -> str:
+            return stream.read().decode(encoding, "replace") if stream else ""
 
         def process_progress_line(line: str):
-            # look for patterns like: "Fetching RSS: [###----] 3/10" or "Fetching pages: [...] 2/8"
-            m = re.search(r"(Fetching RSS|Fetching pages)[: ].*?(\d+)/(\d+)", line)
+            # cheap substring gate; most stderr lines are debug JSON or messages
+            if "Fetching" not in line:
+                return
+            m = _PROG_RE.search(line)
             if not m:
                 return
-            kind = m.group(1)
-            completed = int(m.group(2))
-            total = int(m.group(3))
-
-            def ui_update():
-                try:
-                    if kind == "Fetching RSS":
-                        self.rss_prog.config(maximum=total)
-                        self.rss_prog['value'] = completed
-                        self.rss_label.config(text=f"Fetching RSS: {completed}/{total}")
-                    else:
-                        self.pages_prog.config(maximum=total)
-                        self.pages_prog['value'] = completed
-                        self.pages_label.config(text=f"Fetching pages: {completed}/{total}")
-                except Exception:
-                    pass
-
-            self.root.after(1, ui_update)
-
-        # read stderr char-by-char so we can catch \r-updates
+            key = "rss" if m.group(1) == "Fetching RSS" else "pages"
+            self._evt_q.put(("progress", key, int(m.group(2)), int(m.group(3))))
+
+        # read stderr in chunks straight from the pipe (os.read returns whatever is
+        # available, so \r-updates still arrive promptly) and keep the partial tail.
+        # On POSIX a selector lets the loop notice the child exiting even when a
+        # grandchild (the browser driver) still holds the pipe open; Windows pipes
+        # can't be selected, so there the blocking read waits for EOF.
+        def emit(part: str):
+            process_progress_line(part)
+            # collect debug JSON lines emitted by disprobe.debug_log
+            if _parse_debug_line(part) is not None:
+                self._evt_q.put(("debug", part))
+
+        sel = None
         try:
-            stderr = proc.stderr
+            fd = proc.stderr.fileno()
+            decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+            if os.name != 'nt':
+                sel = selectors.DefaultSelector()
+                sel.register(fd, selectors.EVENT_READ)
+            exited = False
             while True:
-                ch = stderr.read(1)
-                if ch == '' and proc.poll() is not None:
-                    break
-                if ch == '':
-                    continue
-                stderr_buf += ch
+                if sel is not None and not sel.select(0.1):
+                    if proc.poll() is None:
+                        continue
+                    exited = True
+                    # the child may have written its last bytes between the select
+                    # timeout and poll(); drain without blocking on a pipe that a
+                    # grandchild can still hold open
+                    os.set_blocking(fd, False)
+                    chunk = b""
+                    while True:
+                        try:
+                            more = os.read(fd, _READ_CHUNK)
+                        except BlockingIOError:
+                            break
+                        if not more:
+                            break
+                        chunk += more
+                else:
+                    chunk = os.read(fd, _READ_CHUNK)
+                if exited or not chunk:
+                    text = decoder.decode(chunk, final=True)
+                else:
+                    text = decoder.decode(chunk)
+                stderr_buf += text
                 # process on carriage return or newline
-                if '\r' in stderr_buf or '\n' in stderr_buf:
-                    parts = re.split(r"[\r\n]", stderr_buf)
+                if '\r' in text or '\n' in text:
+                    parts = _LINE_SPLIT_RE.split(stderr_buf)
                     for part in parts[:-1]:
-                        process_progress_line(part)
-                        # try to parse debug JSON lines emitted by disprobe.debug_log
-                        try:
-                            j = json.loads(part)
-                        except Exception:
-                            j = None
-                        if isinstance(j, dict) and 'event' in j:
-                            def _append_debug(line=part):
-                                try:
-                                    try:
-                                        self.debug.insert('end', line + "\n")
-                                        self.debug.see('end')
-                                    except Exception:
-                                        pass
-                                except Exception:
-                                    pass
-                            self.root.after(1, _append_debug)
+                        emit(part)
                     stderr_buf = parts[-1]
+                if exited or not chunk:
+                    break
         except Exception:
             # streaming failed; fall back to waiting for process
             proc.wait()
+        finally:
+            if sel is not None:
+                sel.close()
+        # a final line without a trailing newline is still progress/debug output
+        if stderr_buf:
+            emit(stderr_buf)
 
         exit_code = proc.wait()
 
@@ -596,21 +879,20 @@ class DisprobeGUI:
         data = None
         if self.tmp_json.exists():
             try:
-                data = json.loads(self.tmp_json.read_text(encoding="utf-8"))
+                data = self._load_results(self.tmp_json)
             except Exception as e:
                 # try to capture stdout/stderr
                 try:
-                    out = proc.stdout.read() if proc.stdout else ""
+                    out = read_rest(proc.stdout)
                 except Exception:
                     out = ""
-                try:
-                    err = proc.stderr.read() if proc.stderr else ""
-                except Exception:
-                    err = stderr_buf
+                # stderr was consumed above; a reread would block on a pipe that a
+                # surviving grandchild still holds
+                err = stderr_buf
                 data = {"error": f"failed to parse json: {e}", "stdout": out, "stderr": err}
         else:
             try:
-                out = proc.stdout.read() if proc.stdout else ""
+                out = read_rest(proc.stdout)
             except Exception:
                 out = ""
             data = {"error": "no json output", "stdout": out, "stderr": stderr_buf}
@@ -621,21 +903,86 @@ class DisprobeGUI:
                 for line in re.split(r"[\r\n]+", stderr_buf):
                     if not line:
                         continue
-                    try:
-                        j = json.loads(line)
-                    except Exception:
-                        j = None
-                    if isinstance(j, dict) and 'event' in j:
-                        try:
-                            self.debug.insert('end', line + "\n")
-                            self.debug.see('end')
-                        except Exception:
-                            pass
+                    if _parse_debug_line(line) is not None:
+                        self._evt_q.put(("debug", line))
         except Exception:
             pass
 
-        # schedule UI update on main thread
-        self.root.after(10, lambda: self._update_ui(exit_code, data))
+        # hand the results to the Tk thread
+        self._evt_q.put(("done", exit_code, data))
+
+    @staticmethod
+    def _load_results(path: Path) -> dict:
+        """Read the results JSON written by disprobe.
+
+        With ijson the rows are parsed one at a time instead of materializing the
+        whole document text first; without it, fall back to json.loads.
+        """
+        if ijson is None:
+            return json.loads(path.read_text(encoding="utf-8"))
+        data = {}
+        with path.open("rb") as f:
+            summary = next(ijson.items(f, "summary", use_float=True), None)
+            if summary is not None:
+                data["summary"] = summary
+            f.seek(0)
+            data["results"] = list(ijson.items(f, "results.item", use_float=True))
+        return data
+
+    def _pump(self, max_events: int = 256):
+        """Apply queued reader-thread events on the Tk thread."""
+        # reschedule first so an error below can't stop the pump
+        self._pump_after = self.root.after(33, self._pump)
+        progress = {}
+        lines = []
+        done = None
+        try:
+            for _ in range(max_events):
+                evt = self._evt_q.get_nowait()
+                if evt[0] == "progress":
+                    # only the latest count per bar matters
+                    progress[evt[1]] = evt[2:]
+                elif evt[0] == "debug":
+                    lines.append(evt[1])
+                else:
+                    done = evt[1:]
+        except queue.Empty:
+            pass
+        # everything below only queues widget changes; Tk repaints once when the
+        # event loop next goes idle, so no explicit update/update_idletasks here
+        try:
+            if "rss" in progress:
+                completed, total = progress["rss"]
+                self.rss_prog.config(maximum=total, value=completed)
+                self.rss_label.config(text=f"Fetching RSS: {completed}/{total}")
+            if "pages" in progress:
+                completed, total = progress["pages"]
+                self.pages_prog.config(maximum=total, value=completed)
+                self.pages_label.config(text=f"Fetching pages: {completed}/{total}")
+        except Exception:
+            pass
+        if lines:
+            if self.debug is None:
+                pending = self._debug_pending
+                pending.extend(lines)
+                if len(pending) > _DEBUG_MAX_LINES:
+                    del pending[:-_DEBUG_KEEP_LINES]
+            else:
+                try:
+                    self.debug.insert('end', "\n".join(lines) + "\n")
+                    count = int(self.debug.index('end-1c').split('.')[0])
+                    if count > _DEBUG_MAX_LINES:
+                        self.debug.delete('1.0', f"{count - _DEBUG_KEEP_LINES}.0")
+                    self.debug.see('end')
+                except Exception:
+                    pass
+        if done is not None:
+            # "done" is the reader's last event; once the queue is drained the pump
+            # can stop until the next start()
+            if self._evt_q.empty():
+                self.root.after_cancel(self._pump_after)
+                self._pump_after = None
+            self._update_ui(*done)
 
     def _load_settings(self):
         defaults = {
@@ -650,19 +997,32 @@ class DisprobeGUI:
         }
         # keep a canonical copy of defaults for Restore Defaults
         base_defaults = defaults.copy()
+        # what is on disk right now; saving identical settings is skipped
+        self._last_saved = None
         try:
             if self.settings_path.exists():
                 txt = self.settings_path.read_text(encoding="utf-8")
                 loaded = json.loads(txt)
                 defaults.update(loaded)
+                self._last_saved = loaded
         except Exception:
             pass
         self._defaults = base_defaults
         self.settings = defaults
 
     def _save_settings(self):
+        if self.settings == self._last_saved:
+            return
         try:
-            self.settings_path.write_text(json.dumps(self.settings, indent=2), encoding="utf-8")
+            if orjson is not None:
+                payload = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(self.settings, indent=2).encode("utf-8")
+            # write beside the target and swap it in, so a crash never leaves a partial file
+            tmp = self.settings_path.with_suffix(".json.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.settings_path)
+            self._last_saved = dict(self.settings)
         except Exception as e:
             try:
                 messagebox.showerror("Save Settings", f"Failed to save settings: {e}")
@@ -738,8 +1098,8 @@ class DisprobeGUI:
         def on_cancel():
             dlg.destroy()
 
-        ttk.Button(btn_fr, text='Save', command=on_save).pack(side='right', padx=(4,0))
-        ttk.Button(btn_fr, text='Cancel', command=on_cancel).pack(side='right')
+        ttk.Button(btn_fr, text='Save', command=on_save, style="App.TButton").pack(side='right', padx=(4,0))
+        ttk.Button(btn_fr, text='Cancel', command=on_cancel, style="App.TButton").pack(side='right')
 
         def on_restore():
             # populate fields with canonical defaults (do not save)
@@ -757,206 +1117,153 @@ class DisprobeGUI:
                 pass
 
         # place Restore Defaults at the left side of the footer
-        ttk.Button(footer, text='Restore Defaults', command=on_restore).grid(row=0, column=0, sticky='w')
+        ttk.Button(footer, text='Restore Defaults', command=on_restore, style="App.TButton").grid(row=0, column=0, sticky='w')
+
+        # center dialog over parent window once Tk has laid it out on its own,
+        # rather than forcing a synchronous layout pass here
+        first = None
+        try:
+            # focus the first entry widget (Sleep) via grid lookup
+            first_widgets = frm.grid_slaves(row=0, column=1)
+            if first_widgets:
+                first = first_widgets[0]
+        except Exception:
+            pass
+        dlg.after_idle(self._center_dialog, dlg, first)
 
-        # center dialog over parent window
+    def _center_dialog(self, dlg, focus=None):
         try:
-            dlg.update_idletasks()
             rw = self.root.winfo_width()
             rh = self.root.winfo_height()
             rx = self.root.winfo_rootx()
             ry = self.root.winfo_rooty()
-            dw = dlg.winfo_width()
-            dh = dlg.winfo_height()
+            # an unmapped dialog reports 1x1; its requested size is what it will get
+            dw = dlg.winfo_width() if dlg.winfo_ismapped() else dlg.winfo_reqwidth()
+            dh = dlg.winfo_height() if dlg.winfo_ismapped() else dlg.winfo_reqheight()
             x = rx + max(0, (rw - dw) // 2)
             y = ry + max(0, (rh - dh) // 2)
             dlg.geometry(f"+{x}+{y}")
             # bring to front and focus first input
-            try:
-                dlg.lift()
-                dlg.focus_force()
-                # focus the first entry widget (Sleep) via grid lookup
-                try:
-                    first_widgets = frm.grid_slaves(row=0, column=1)
-                    if first_widgets:
-                        try:
-                            first_widgets[0].focus_set()
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-            except Exception:
-                pass
+            dlg.lift()
+            dlg.focus_force()
+            if focus is not None:
+                focus.focus_set()
         except Exception:
             pass
 
+    def _tree_tag_opts(self) -> dict:
+        # status tags only set foreground; the background is the Treeview style's
+        st_colors = _ST_COLORS_DARK if self.is_dark else _ST_COLORS_LIGHT
+        return {
+            "st_up_to_date": {"foreground": st_colors["UP TO DATE"]},
+            "st_update_available": {"foreground": st_colors["UPDATE AVAILABLE"]},
+            "st_local_ahead": {"foreground": st_colors["LOCAL AHEAD"]},
+            "st_unknown": {"foreground": self.fg},
+        }
+
+    def _init_tree_tags(self):
+        """Create the status tags once, in the startup palette."""
+        tag_opts = self._tree_tag_opts()
+        for tag, opts in tag_opts.items():
+            self.tree.tag_configure(tag, **opts)
+        self._tag_opts = tag_opts
+
+    def _style_call(self, style, method, name, **kw):
+        # ttk restyles every widget using `name` on each configure/map, so only
+        # forward options whose value differs from what was last sent
+        cached = self._style_cache.setdefault((method, name), {})
+        if all(k in cached and cached[k] == v for k, v in kw.items()):
+            return
+        getattr(style, method)(name, **kw)
+        cached.update(kw)
+
+    def _configure_if_changed(self, style, name, **kw):
+        self._style_call(style, "configure", name, **kw)
+
+    def _map_if_changed(self, style, name, **kw):
+        self._style_call(style, "map", name, **kw)
+
+    @staticmethod
+    def _safe(fn, *args, **kw) -> bool:
+        """Call fn best-effort; report whether it went through."""
+        try:
+            fn(*args, **kw)
+            return True
+        except Exception:
+            return False
+
     def apply_theme(self):
-        # apply current theme colors to widgets
+        # apply current theme colors to widgets; restyling re-lays out every
+        # themed widget, so skip it when the palette hasn't changed
+        key = (bool(self.is_dark),)
+        if key == self._applied_theme_key:
+            return
+        safe = self._safe
+        if self.is_dark:
+            self.fg = "#ffffff"
+            bg = "#202020"
+            hover_bg = "#3a3a3a"
+            thumb = "#555555"
+        else:
+            self.fg = "#000000"
+            bg = "#f7f7f7"
+            hover_bg = "#e6e6e6"
+            thumb = "#909090"
+        fg = self.fg
         try:
-            if self.is_dark:
-                self.fg = "#ffffff"
-                odd_bg = "#252525"
-                even_bg = "#202020"
-            else:
-                self.fg = "#000000"
-                odd_bg = "#ffffff"
-                even_bg = "#f7f7f7"
             style = ttk.Style()
-            try:
-                # set tree foreground and backgrounds
-                bg = even_bg
-                style.configure("Treeview", foreground=self.fg, background=bg, fieldbackground=bg)
-                style.configure("Treeview.Heading", foreground=self.fg)
-                style.map("Treeview.Heading", foreground=[("active", self.fg), ("!disabled", self.fg)])
-            except Exception:
-                pass
-            try:
-                # ensure row background tags are updated; status foreground tags updated below
-                self.tree.tag_configure("odd", background=odd_bg)
-                self.tree.tag_configure("even", background=even_bg)
-                # status tags: choose colors appropriate for current theme
-                if self.is_dark:
-                    st_colors = {
-                        "UP TO DATE": "#00FFFF",          # cyan
-                        "UPDATE AVAILABLE": "#FFF59D",   # light yellow
-                        "LOCAL AHEAD": "#FF77FF",        # light magenta
-                        "UNKNOWN": self.fg,
-                    }
-                else:
-                    st_colors = {
-                        "UP TO DATE": "#008B8B",         # darker cyan
-                        "UPDATE AVAILABLE": "#B28700",  # darker yellow/gold
-                        "LOCAL AHEAD": "#9A00A8",       # darker magenta/purple
-                        "UNKNOWN": self.fg,
-                    }
-                try:
-                    self.tree.tag_configure("st_up_to_date", foreground=st_colors["UP TO DATE"])
-                    self.tree.tag_configure("st_update_available", foreground=st_colors["UPDATE AVAILABLE"])
-                    self.tree.tag_configure("st_local_ahead", foreground=st_colors["LOCAL AHEAD"])
-                    self.tree.tag_configure("st_unknown", foreground=st_colors["UNKNOWN"])
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            try:
-                if hasattr(self, 'header_canvas') and self.header_canvas:
-                    try:
-                        self.header_canvas.configure(bg=bg)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            try:
-                # frame and general widget backgrounds
-                try:
-                    style.configure("App.TFrame", background=bg)
-                    self.frame.configure(style="App.TFrame")
-                    self.top.configure(style="App.TFrame")
-                    self.bot.configure(style="App.TFrame")
-                    self.tree_frame.configure(style="App.TFrame")
-                except Exception:
-                    try:
-                        self.frame.configure(background=bg)
-                        self.top.configure(background=bg)
-                        self.bot.configure(background=bg)
-                        self.tree_frame.configure(background=bg)
-                    except Exception:
-                        pass
-                try:
-                    style.configure("TLabel", background=bg, foreground=self.fg)
-                    style.configure("TButton", background=bg, foreground=self.fg)
-                except Exception:
-                    try:
-                        self.status_lbl.configure(background=bg, foreground=self.fg)
-                        self.run_btn.configure(background=bg, foreground=self.fg)
-                        self.open_cfg_btn.configure(background=bg, foreground=self.fg)
-                        try:
-                            self.settings_btn.configure(background=bg, foreground=self.fg)
-                        except Exception:
-                            pass
-                        self.raw_btn.configure(background=bg, foreground=self.fg)
-                    except Exception:
-                        pass
-                # button hover / active mapping
-                try:
-                    hover_bg = "#3a3a3a" if self.is_dark else "#e6e6e6"
-                    hover_fg = self.fg
-                    style.map('TButton', background=[('active', hover_bg), ('!disabled', bg)], foreground=[('active', hover_fg), ('!disabled', self.fg)])
-                except Exception:
-                    pass
-                # progressbar and scrollbar styling
-                try:
-                    style.configure('TProgressbar', troughcolor=bg, background=self.fg)
-                    style.configure('Horizontal.TProgressbar', troughcolor=bg, background=self.fg)
-                except Exception:
-                    pass
-                try:
-                    style.configure('Vertical.TScrollbar', troughcolor=bg, background=bg)
-                    style.configure('Horizontal.TScrollbar', troughcolor=bg, background=bg)
-                    # attempt to style ttk scrollbars; if we replaced with tk.Scrollbar,
-                    # configure the widget colors directly below
-                    try:
-                        if hasattr(self, 'v_scroll') and self.v_scroll and isinstance(self.v_scroll, ttk.Scrollbar):
-                            self.v_scroll.configure(style='Vertical.TScrollbar')
-                        if hasattr(self, 'h_scroll') and self.h_scroll and isinstance(self.h_scroll, ttk.Scrollbar):
-                            self.h_scroll.configure(style='Horizontal.TScrollbar')
-                    except Exception:
-                        pass
-                except Exception:
-                    # fallback: configure individual scrollbar widgets directly (tk-based SimpleScrollbar)
-                    try:
-                        if hasattr(self, 'v_scroll') and self.v_scroll:
-                            try:
-                                # set bg and thumb color for our SimpleScrollbar
-                                thumb = "#555555" if self.is_dark else "#909090"
-                                try:
-                                    self.v_scroll.configure(bg=bg, thumbcolor=thumb, activebackground=hover_bg, highlightbackground=bg, highlightcolor=bg)
-                                except Exception:
-                                    try:
-                                        self.v_scroll.configure(bg=bg)
-                                    except Exception:
-                                        pass
-                                try:
-                                    self.v_scroll._thumb_color = thumb
-                                    self.v_scroll._draw()
-                                except Exception:
-                                    pass
-                            except Exception:
-                                try:
-                                    self.v_scroll.configure(bg=bg)
-                                except Exception:
-                                    pass
-                        # horizontal scrollbar intentionally omitted; ignore if present
-                        if hasattr(self, 'h_scroll') and self.h_scroll:
-                            try:
-                                self.h_scroll.configure(bg=bg)
-                            except Exception:
-                                pass
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            try:
-                # progressbar/trough colors (best-effort)
-                try:
-                    style.configure('TProgressbar', troughcolor=bg, background=self.fg)
-                except Exception:
-                    try:
-                        style.configure('Horizontal.TProgressbar', troughcolor=bg, background=self.fg)
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-            try:
-                # raw text view colors
-                try:
-                    self.raw.configure(bg=bg, fg=self.fg)
-                except Exception:
-                    pass
-            except Exception:
-                pass
         except Exception:
-            pass
+            return
+
+        # set tree foreground and backgrounds
+        safe(self._configure_if_changed, style, "Treeview", foreground=fg, background=bg, fieldbackground=bg)
+        safe(self._configure_if_changed, style, "Treeview.Heading", foreground=fg)
+        safe(self._map_if_changed, style, "Treeview.Heading", foreground=[("active", fg), ("!disabled", fg)])
+
+        # recolour only the tags whose colours moved since the last apply
+        tag_opts = self._tree_tag_opts()
+        for tag, opts in tag_opts.items():
+            if self._tag_opts.get(tag) != opts:
+                safe(self.tree.tag_configure, tag, **opts)
+        self._tag_opts = tag_opts
+
+        if self.header_canvas is not None:
+            safe(self.header_canvas.configure, bg=bg)
+
+        # frame and general widget backgrounds through named ttk styles; frames
+        # built after the first apply (the bottom bar) are skipped
+        safe(self._configure_if_changed, style, "App.TFrame", background=bg)
+        for f in (self.frame, self.top, self.bot, self.tree_frame):
+            if f is not None:
+                safe(f.configure, style="App.TFrame")
+        safe(self._configure_if_changed, style, "TLabel", background=bg, foreground=fg)
+        safe(self._configure_if_changed, style, "App.TButton", background=bg, foreground=fg)
+        # button hover / active mapping
+        safe(self._map_if_changed, style, 'App.TButton',
+             background=[('active', hover_bg), ('!disabled', bg)],
+             foreground=[('active', fg), ('!disabled', fg)])
+        # progressbar and scrollbar styling
+        safe(self._configure_if_changed, style, 'TProgressbar', troughcolor=bg, background=fg)
+        safe(self._configure_if_changed, style, 'Horizontal.TProgressbar', troughcolor=bg, background=fg)
+        safe(self._configure_if_changed, style, 'Vertical.TScrollbar', troughcolor=bg, background=bg)
+        safe(self._configure_if_changed, style, 'Horizontal.TScrollbar', troughcolor=bg, background=bg)
+
+        if isinstance(self.v_scroll, ttk.Scrollbar):
+            safe(self.v_scroll.configure, style='Vertical.TScrollbar')
+        elif self.v_scroll is not None:
+            # the tk-based SimpleScrollbar isn't styled by ttk; colour it directly
+            if not safe(self.v_scroll.configure, bg=bg, thumbcolor=thumb, activebackground=hover_bg,
+                        highlightbackground=bg, highlightcolor=bg):
+                safe(self.v_scroll.configure, bg=bg)
+            self.v_scroll._thumb_color = thumb
+            safe(self.v_scroll._draw)
+
+        # raw/debug text view colors; panes created later pick up _text_bg
+        self._text_bg = bg
+        for txt in (self.raw, self.debug):
+            if txt is not None:
+                safe(txt.configure, bg=bg, fg=fg)
+        self._applied_theme_key = key
 
     # theme toggle removed; theming is applied automatically at startup
 
@@ -971,17 +1278,22 @@ class DisprobeGUI:
                 return
         except Exception:
             pass
-        # macOS / Linux fallback
+        import subprocess
+
+        # macOS / Linux fallback; the opener is spawned detached so the GUI thread
+        # doesn't wait on xdg-open's shell chain (or on notepad being closed)
+        detached = dict(stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL, start_new_session=True)
         try:
             if sys.platform == "darwin":
-                subprocess.run(["open", str(cfg)])
+                subprocess.Popen(["open", str(cfg)], **detached)
             else:
-                subprocess.run(["xdg-open", str(cfg)])
+                subprocess.Popen(["xdg-open", str(cfg)], **detached)
         except Exception:
             # last resort: open with notepad (Windows) or print path
             try:
                 if sys.platform.startswith("win"):
-                    subprocess.run(["notepad", str(cfg)])
+                    subprocess.Popen(["notepad", str(cfg)], **detached)
                 else:
                     print(f"Please open: {cfg}")
             except Exception:
@@ -1005,50 +1317,46 @@ class DisprobeGUI:
         except Exception:
             pass
 
-        # populate tree with alternating row backgrounds for clarity
+        # populate tree, colouring each row by its status; rows are
+        # built off to the side and handed to _render_rows in one go
         results = data.get("results") or []
-        for idx, row in enumerate(results):
-            d = row.get("distro") if isinstance(row, dict) else (row[0] if len(row) > 0 else "")
-            if isinstance(row, dict):
-                lv = row.get("local_version", "")
-                dv = row.get("latest_version", "")
-                st = row.get("status", "")
-                src = row.get("source", "")
+        rows = []
+        row_tags = []
+        # module globals and bound methods used per row, as locals
+        fields = _RESULT_FIELDS
+        legacy = _LEGACY_FIELDS
+        st_tag_of = _ST_TAG.get
+        dict_t = dict
+        add_row = rows.append
+        add_tags = row_tags.append
+        pad = ("",) * 6
+        for row in results:
+            if isinstance(row, dict_t):
+                get = row.get
+                d, lv, dv, st, src = [get(k, "") for k in fields]
             else:
-                # legacy tuple-style
-                lv = row[1] if len(row) > 1 else ""
-                dv = row[2] if len(row) > 2 else ""
-                st = row[3] if len(row) > 3 else ""
-                src = row[5] if len(row) > 5 else ""
-            row_bg_tag = "odd" if (idx % 2) == 0 else "even"
+                # legacy tuple-style; short rows are padded with blanks
+                d, lv, dv, st, src = legacy((*row, *pad))
             # map status string to a status tag (use uppercase keys as produced by disprobe)
-            st_key = (st or "").upper()
-            if st_key == "UP TO DATE":
-                st_tag = "st_up_to_date"
-            elif st_key == "UPDATE AVAILABLE":
-                st_tag = "st_update_available"
-            elif st_key == "LOCAL AHEAD":
-                st_tag = "st_local_ahead"
-            else:
-                st_tag = "st_unknown"
+            st_tag = st_tag_of(st.upper() if st else "", "st_unknown")
 
-            vals = (d, "|", lv, "|", dv, "|", st, "|", src)
-            try:
-                self.tree.insert("", "end", values=vals, tags=(row_bg_tag, st_tag))
-            except Exception:
-                # fallback to single tag
-                try:
-                    self.tree.insert("", "end", values=vals, tags=(row_bg_tag,))
-                except Exception:
-                    self.tree.insert("", "end", values=vals)
+            add_row((d, lv, dv, st, src))
+            add_tags(st_tag)
+        self._rows = rows
+        self._row_tags = row_tags
+        self._view_first = 0
+        self._render_rows()
 
-        # show raw
-        self.raw.delete("1.0", "end")
+        self._set_raw_data(data)
+
+    def _set_raw_data(self, data):
+        self._raw_data = data
+        self._raw_rendered = False
         try:
-            pretty = json.dumps(data, indent=2)
+            if self.raw is not None and self.raw.winfo_ismapped():
+                self._ensure_raw_rendered()
         except Exception:
-            pretty = str(data)
-        self.raw.insert("1.0", pretty)
+            pass
 
 
 def main():